@@ -16,31 +16,34 @@ environment variables must be entered in the
 import os
 from pathlib import Path
 
+_PIP_VARS = ("PIP_PROTOCOL", "PIP_REPOSITORY", "PIP_USERNAME", "PIP_PASSWORD")
+
 
 def main():
-    prot = os.getenv("PIP_PROTOCOL")
-    repo = os.getenv("PIP_REPOSITORY")
-    user = os.getenv("PIP_USERNAME")
-    passw = os.getenv("PIP_PASSWORD")
+    env = os.environ
+    vals = {key: env.get(key) for key in _PIP_VARS}
+    missing = [key for key, val in vals.items() if val is None]
     configpath = os.path.expanduser("~/.config/pip")
     print(os.getcwd())
 
-    if prot is repo is user is passw is None:
+    if len(missing) == len(_PIP_VARS):
         print("No secrets provided, doing nothing.")
-    elif None in [prot, repo, user, passw]:
-        raise Exception("PIP environment variables incomplete.")
+    elif missing:
+        raise Exception(f"PIP environment variables incomplete, missing: {', '.join(missing)}.")
     else:
+        prot, repo, user, passw = (vals[key] for key in _PIP_VARS)
         if os.path.exists(f"{configpath}/pip.conf"):
             raise Exception(f"{configpath}/pip.conf exists, refusing to overwrite.")
         Path(configpath).mkdir(parents=True, exist_ok=True)
-        with open(f"{configpath}/pip.conf", "w") as outfile:
-            outfile.write(
-                f"[global]\n"
-                f"index = {prot}://{user}:{passw}@{repo}/pypi\n"
-                f"index-url = {prot}://{user}:{passw}@{repo}/simple\n"
-            )
-            if prot == "http":
-                outfile.write(f"trusted-host = {repo.split('/')[0]}")
+        lines = [
+            "[global]",
+            f"index = {prot}://{user}:{passw}@{repo}/pypi",
+            f"index-url = {prot}://{user}:{passw}@{repo}/simple",
+        ]
+        if prot == "http":
+            lines.append(f"trusted-host = {repo.split('/')[0]}")
+        with open(f"{configpath}/pip.conf", "w", encoding="utf-8") as outfile:
+            outfile.write("\n".join(lines) + "\n")
         print("Created config ~/.config/pip/pip.conf")
 
 
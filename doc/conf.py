@@ -12,7 +12,9 @@
 #
 
 import os
+import re
 import sys
+from pathlib import Path
 
 from sphinx.locale import _
 
@@ -20,16 +22,13 @@ sys.path.insert(0, os.path.abspath(".."))
 
 # -- Project information -----------------------------------------------------
 
-with open("../scheduler/__init__.py", "r") as file:
-    for line in file:
-        if "__version__" in line:
-            version = line.split('"')[1]
-        if "__author__" in line:
-            author = line.split('"')[1]
+_META_PATTERN = re.compile(r'^__(version|author)__\s*=\s*"([^"]+)"', re.MULTILINE)
+_meta = dict(_META_PATTERN.findall(Path("../scheduler/__init__.py").read_text(encoding="utf-8")))
+version = _meta["version"]
+author = _meta["author"]
 
 project = "scheduler"
 copyright = "2023, " + author
-author = author
 
 # The full version, including alpha/beta/rc tags
 release = version
@@ -4,10 +4,33 @@ A simple in-process python `scheduler` library for `datetime` objects.
 Author: Jendrik A. Potyka, Fabian A. Preiss
 """
 
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.8.7"
 __author__ = "Jendrik A. Potyka, Fabian A. Preiss"
 
-from scheduler.error import SchedulerError
-from scheduler.threading.scheduler import Scheduler
+if TYPE_CHECKING:  # pragma: no cover
+    from scheduler.error import SchedulerError
+    from scheduler.threading.scheduler import Scheduler
 
 __all__ = ["SchedulerError", "Scheduler"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the public objects on first access (PEP 562)."""
+    if name == "Scheduler":
+        from scheduler.threading.scheduler import Scheduler  # pylint: disable=C0415
+
+        globals()["Scheduler"] = Scheduler
+        return Scheduler
+    if name == "SchedulerError":
+        from scheduler.error import SchedulerError  # pylint: disable=C0415
+
+        globals()["SchedulerError"] = SchedulerError
+        return SchedulerError
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported public objects alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
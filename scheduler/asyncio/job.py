@@ -31,7 +31,7 @@ class Job(BaseJob[Callable[..., Coroutine[Any, Any, None]]]):
     max_attempts : Optional[int]
         Number of times the |AioJob| will be executed where ``0 <=> inf``.
         A |AioJob| with no free attempt will be deleted.
-    tags : Optional[set[str]]
+    tags : Optional[Iterable[str]]
         The tags of the |AioJob|.
     delay : Optional[bool]
         *Deprecated*: If ``True`` wait with the execution for the next scheduled time.
@@ -56,6 +56,8 @@ class Job(BaseJob[Callable[..., Coroutine[Any, Any, None]]]):
         Instance of a scheduled |AioJob|.
     """
 
+    __slots__ = ()
+
     # pylint: disable=no-member invalid-name
 
     async def _exec(self, logger: Logger) -> None:
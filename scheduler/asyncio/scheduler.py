@@ -8,17 +8,33 @@ from __future__ import annotations
 
 import asyncio as aio
 import datetime as dt
+import heapq
+import itertools
+import time
 from asyncio.selector_events import BaseSelectorEventLoop
 from collections.abc import Iterable
 from logging import Logger
 from typing import Any, Callable, Coroutine, Optional
 
-import typeguard as tg
-
 from scheduler.asyncio.job import Job
-from scheduler.base.definition import JOB_TYPE_MAPPING, JobType
-from scheduler.base.scheduler import BaseScheduler, deprecated, select_jobs_by_tag
-from scheduler.base.scheduler_util import check_tzname, create_job_instance, str_cutoff
+from scheduler.base.definition import JobType
+from scheduler.base.scheduler import (
+    BaseScheduler,
+    deprecated,
+    index_job_tags,
+    select_jobs_by_tag_index,
+    sort_jobs_by_due,
+    unindex_job_tags,
+)
+from scheduler.base.scheduler_util import (
+    TIMING_CHECKS,
+    TIMING_VALIDATORS,
+    check_timing,
+    check_tzname,
+    create_job_instance,
+    once_job_type,
+    str_cutoff,
+)
 from scheduler.base.timingtype import (
     TimingCyclic,
     TimingDailyUnion,
@@ -26,13 +42,25 @@ from scheduler.base.timingtype import (
     TimingWeeklyUnion,
 )
 from scheduler.error import SchedulerError
-from scheduler.message import (
-    CYCLIC_TYPE_ERROR_MSG,
-    DAILY_TYPE_ERROR_MSG,
-    HOURLY_TYPE_ERROR_MSG,
-    MINUTELY_TYPE_ERROR_MSG,
-    ONCE_TYPE_ERROR_MSG,
-    WEEKLY_TYPE_ERROR_MSG,
+
+# NOTE: similar to asyncio's event loop, the heap is only rebuilt if there is a
+#       significant number of entries belonging to deleted jobs
+_MIN_STALE_ENTRIES = 100
+# like asyncio's event loop, treat timers within the clock resolution as due
+_CLOCK_RESOLUTION = time.get_clock_info("monotonic").resolution
+# number of idle execution workers kept around for reuse
+_MAX_IDLE_WORKERS = 8
+
+# Job table columns of the `__str__` method (we join two of the Job._repr() fields into one)
+_C_ALIGN = ("<", "<", "<", "<", ">", ">")
+_C_WIDTH = (8, 16, 19, 12, 9, 13)
+_C_NAME = (
+    "type",
+    "function / alias",
+    "due at",
+    "tzinfo",
+    "due in",
+    "attempts",
 )
 
 
@@ -58,6 +86,23 @@ class Scheduler(BaseScheduler[Job, Callable[..., Coroutine[Any, Any, None]]]):
         A custom Logger instance.
     """
 
+    __slots__ = (
+        "__loop",
+        "__tzinfo",
+        "__tz_str",
+        "__row_fmt",
+        "_jobs",
+        "__tag_index",
+        "__heap",
+        "__seq",
+        "__waiter",
+        "__supervisor",
+        "__exec_tasks",
+        "__running",
+        "__idle_workers",
+        "__finished",
+    )
+
     def __init__(
         self,
         *,
@@ -73,50 +118,61 @@ class Scheduler(BaseScheduler[Job, Callable[..., Coroutine[Any, Any, None]]]):
         self.__tzinfo = tzinfo
         self.__tz_str = check_tzname(tzinfo=tzinfo)
 
-        self._jobs: dict[Job, aio.Task[None]] = {}
+        # the row format of the job table only depends on the timezone
+        form = [
+            f"{{{idx}:{align}{width}}}"
+            for idx, (align, width) in enumerate(zip(_C_ALIGN, _C_WIDTH))
+        ]
+        if self.__tz_str is None:
+            form = form[:3] + form[4:]
+        self.__row_fmt = " ".join(form) + "\n"
+
+        # scheduled jobs, mapped to the sequence number of their live heap entry
+        self._jobs: dict[Job, Optional[int]] = {}
+        # scheduled jobs by each of their tags
+        self.__tag_index: dict[str, set[Job]] = {}
+        # min-heap of (due time on the loop clock, sequence number, job) entries,
+        # entries of deleted jobs are dropped lazily when they reach the top
+        self.__heap: list[tuple[float, int, Job]] = []
+        self.__seq = itertools.count()
+        # future the idle supervisor awaits, see `__wake`
+        self.__waiter: Optional[aio.Future[None]] = None
+        self.__supervisor: Optional[aio.Task[None]] = None
+        self.__exec_tasks: set[aio.Task[None]] = set()
+        # worker task of each executing job, cancelled if the job gets deleted
+        self.__running: dict[Job, aio.Task[None]] = {}
+        # futures of idle execution workers waiting for their next job, most recent last
+        self.__idle_workers: list[aio.Future[Optional[Job]]] = []
+        self.__finished: list[Job] = []
 
     def __repr__(self) -> str:
         return "scheduler.asyncio.scheduler.Scheduler({0}, jobs={{{1}}})".format(
             ", ".join((repr(elem) for elem in (self.__tzinfo,))),
-            ", ".join([repr(job) for job in sorted(self.jobs)]),
+            ", ".join([repr(job) for job in sort_jobs_by_due(self._jobs)]),
         )
 
     def __str__(self) -> str:
         # Scheduler meta heading
         scheduler_headings = "{0}, {1}\n\n".format(*self.__headings())
 
-        # Job table (we join two of the Job._repr() fields into one)
-        # columns
-        c_align = ("<", "<", "<", "<", ">", ">")
-        c_width = (8, 16, 19, 12, 9, 13)
-        c_name = (
-            "type",
-            "function / alias",
-            "due at",
-            "tzinfo",
-            "due in",
-            "attempts",
-        )
-        form = [
-            f"{{{idx}:{align}{width}}}" for idx, (align, width) in enumerate(zip(c_align, c_width))
-        ]
-        if self.__tz_str is None:
-            form = form[:3] + form[4:]
-
-        fstring = " ".join(form) + "\n"
-        job_table = fstring.format(*c_name)
-        job_table += fstring.format(*("-" * width for width in c_width))
-        for job in sorted(self.jobs):
-            row = job._str()
-            entries = (
-                row[0],
-                str_cutoff(row[1] + row[2], c_width[1], False),
-                row[3],
-                str_cutoff(row[4] or "", c_width[3], False),
-                str_cutoff(row[5], c_width[4], True),
-                str_cutoff(f"{row[6]}/{row[7]}", c_width[5], True),
+        # Job table
+        fmt_row = self.__row_fmt.format
+        c_width = _C_WIDTH
+        rows = [fmt_row(*_C_NAME), fmt_row(*("-" * width for width in c_width))]
+        dt_stamp = dt.datetime.now(self.__tzinfo)
+        for job in sort_jobs_by_due(self._jobs):
+            row = job._str(dt_stamp)
+            rows.append(
+                fmt_row(
+                    row.type,
+                    str_cutoff(row.name + row.f_args, c_width[1], False),
+                    row.at,
+                    str_cutoff(row.tz, c_width[3], False),
+                    str_cutoff(row.in_, c_width[4], True),
+                    str_cutoff(f"{row.attempts}/{row.max_attempts}", c_width[5], True),
+                )
             )
-            job_table += fstring.format(*entries)
+        job_table = "".join(rows)
 
         return scheduler_headings + job_table
 
@@ -133,29 +189,173 @@ class Scheduler(BaseScheduler[Job, Callable[..., Coroutine[Any, Any, None]]]):
     ) -> Job:
         """Encapsulate the `Job` and add the `Scheduler`'s timezone."""
         job: Job = create_job_instance(Job, tzinfo=self.__tzinfo, **kwargs)
-
-        task = self.__loop.create_task(self.__supervise_job(job))
-        self._jobs[job] = task
-
+        if job.has_attempts_remaining:
+            self.__push(job, dt.datetime.now(tz=self.__tzinfo))
+            index_job_tags(self.__tag_index, job)
         return job
 
-    async def __supervise_job(self, job: Job) -> None:
-        try:
-            reference_dt = dt.datetime.now(tz=self.__tzinfo)
-            while job.has_attempts_remaining:
-                sleep_seconds: float = job.timedelta(reference_dt).total_seconds()
-                await aio.sleep(sleep_seconds)
+    def __schedule_timed(
+        self,
+        job_type: JobType,
+        timing: Any,
+        handle: Callable[..., Coroutine[Any, Any, None]],
+        **kwargs,
+    ) -> Job:
+        """Check the `timing` of a periodic `Job` and schedule it."""
+        timing_type, err_msg = TIMING_CHECKS[job_type]
+        check_timing(timing, TIMING_VALIDATORS[job_type], timing_type, err_msg)
+        return self.__schedule(job_type=job_type, timing=timing, handle=handle, **kwargs)
+
+    def __push(self, job: Job, reference_dt: dt.datetime) -> None:
+        """Add the next execution of a `Job` to the heap and wake the supervisor if needed."""
+        when = self.__loop.time() + job.timedelta(reference_dt).total_seconds()
+        seq = next(self.__seq)
+        self._jobs[job] = seq
+        heapq.heappush(self.__heap, (when, seq, job))
+
+        if self.__supervisor is None:
+            self.__supervisor = self.__loop.create_task(self.__supervise())
+        elif self.__heap[0][1] == seq:
+            self.__wake()
+
+        n_stale = len(self.__heap) - len(self._jobs)
+        if n_stale > _MIN_STALE_ENTRIES and 2 * n_stale > len(self.__heap):
+            self.__compact()
+
+    def __wake(self) -> None:
+        r"""
+        Resume the supervisor if it is waiting.
 
+        A wake up without a waiting supervisor can be dropped, the supervisor
+        reevaluates the heap and the finished `Job`\ s before waiting again.
+        """
+        waiter = self.__waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def __compact(self) -> None:
+        r"""Remove the entries of deleted `Job`\ s from the heap."""
+        jobs = self._jobs
+        self.__heap = [entry for entry in self.__heap if jobs.get(entry[2]) == entry[1]]
+        heapq.heapify(self.__heap)
+
+    async def __supervise(self) -> None:
+        """Sleep until the next `Job` is due and dispatch its execution."""
+        loop = self.__loop
+        tz = self.__tzinfo
+        finished = self.__finished
+        try:
+            while self._jobs:
+                if finished:
+                    # one reference time for every job that finished since the last tick
+                    reference_dt = dt.datetime.now(tz=tz)
+                    for job in finished:
+                        self.__reschedule(job, reference_dt)
+                    finished.clear()
+                    continue
+                heap = self.__heap
+                if not heap:
+                    # all remaining jobs are executing right now
+                    self.__waiter = loop.create_future()
+                    await self.__waiter
+                    continue
+                when, seq, job = heap[0]
+                if self._jobs.get(job) != seq:
+                    heapq.heappop(heap)
+                    continue
+                if when > loop.time() + _CLOCK_RESOLUTION:
+                    # a single timer handle on the loop, a new head or a finished job
+                    # wakes the supervisor earlier
+                    waiter = self.__waiter = loop.create_future()
+                    timer = loop.call_at(when, self.__on_timer)
+                    try:
+                        await waiter
+                    finally:
+                        timer.cancel()
+                    continue
+                # overdue jobs are caught up without any timer
+                self.__dispatch_due()
+                await aio.sleep(0)
+        finally:
+            finished.clear()
+            self.__supervisor = None
+            # release the parked workers, busy workers exit after their execution
+            for waiter in self.__idle_workers:
+                if not waiter.done():
+                    waiter.set_result(None)
+            self.__idle_workers.clear()
+
+    def __on_timer(self) -> None:
+        # dispatch right from the timer callback instead of waiting for the
+        # supervisor's next step, the supervisor then only arms the next timer
+        self.__dispatch_due()
+        self.__wake()
+
+    def __dispatch_due(self) -> None:
+        """Dispatch every `Job` that is due in this tick at once."""
+        heap = self.__heap
+        jobs = self._jobs
+        end_time = self.__loop.time() + _CLOCK_RESOLUTION
+        while heap and heap[0][0] <= end_time:
+            _, seq, job = heapq.heappop(heap)
+            if jobs.get(job) == seq:
+                jobs[job] = None
+                self.__dispatch(job)
+
+    def __dispatch(self, job: Job) -> None:
+        idle_workers = self.__idle_workers
+        while idle_workers:
+            # reuse the most recently parked worker
+            waiter = idle_workers.pop()
+            if not waiter.done():
+                waiter.set_result(job)
+                return
+        task = self.__loop.create_task(self.__exec_worker(job))
+        self.__exec_tasks.add(task)
+        task.add_done_callback(self.__exec_tasks.discard)
+
+    async def __exec_worker(self, job: Optional[Job]) -> None:
+        r"""Execute dispatched `Job`\ s, park in between while the `Scheduler` has `Job`\ s."""
+        loop = self.__loop
+        idle_workers = self.__idle_workers
+        running = self.__running
+        task: aio.Task[None] = aio.current_task()  # type: ignore[assignment]
+        while job is not None:
+            running[job] = task
+            try:
                 await job._exec(logger=self._logger)  # pylint: disable=protected-access
+            finally:
+                # NOTE: a cancellation by `delete_job` ends the worker right here
+                if running.get(job) is task:
+                    del running[job]
+            self.__finished.append(job)
+            self.__wake()
+            if not self._jobs or len(idle_workers) >= _MAX_IDLE_WORKERS:
+                return
+            waiter: aio.Future[Optional[Job]] = loop.create_future()
+            idle_workers.append(waiter)
+            job = await waiter
+
+    def __reschedule(self, job: Job, reference_dt: dt.datetime) -> None:
+        if job not in self._jobs:
+            return  # deleted during the execution
+        if job.max_attempts and job.attempts >= job.max_attempts:
+            # e.g. oneshot jobs, there is no next execution to calculate
+            self.delete_job(job)
+            return
 
-                reference_dt = dt.datetime.now(tz=self.__tzinfo)
-                job._calc_next_exec(reference_dt)  # pylint: disable=protected-access
-        except aio.CancelledError:  # TODO asyncio does not trigger this exception in pytest, why?
-            # raised, when `task.cancel()` in `delete_job` was run
-            pass  # pragma: no cover
+        job._calc_next_exec(reference_dt)  # pylint: disable=protected-access
+        if job.has_attempts_remaining:
+            self.__push(job, reference_dt)
         else:
             self.delete_job(job)
 
+    def __cancel(self, job: Job) -> None:
+        """Cancel the running execution of a deleted `Job`."""
+        task = self.__running.pop(job, None)
+        if task is not None:
+            task.cancel()
+
     def delete_job(self, job: Job) -> None:
         """
         Delete a `Job` from the `Scheduler`.
@@ -171,10 +371,15 @@ class Scheduler(BaseScheduler[Job, Callable[..., Coroutine[Any, Any, None]]]):
             Raises if the |AioJob| of the argument is not scheduled.
         """
         try:
-            task: aio.Task[None] = self._jobs.pop(job)
-            _: bool = task.cancel()
+            del self._jobs[job]
         except KeyError:
             raise SchedulerError("An unscheduled Job can not be deleted!") from None
+        unindex_job_tags(self.__tag_index, job)
+        self.__cancel(job)
+        if not self._jobs:
+            # let the idle supervisor finish instead of waiting for a stale entry
+            self.__heap.clear()
+            self.__wake()
 
     def delete_jobs(
         self,
@@ -195,17 +400,27 @@ class Scheduler(BaseScheduler[Job, Callable[..., Coroutine[Any, Any, None]]]):
             False: To delete a |AioJob| all tags have to match.
             True: To delete a |AioJob| at least one tag has to match.
         """
-        all_jobs: set[Job] = set(self._jobs.keys())
-        jobs_to_delete: set[Job]
-
+        jobs = self._jobs
         if tags is None or tags == set():
-            jobs_to_delete = all_jobs
-        else:
-            jobs_to_delete = select_jobs_by_tag(all_jobs, tags, any_tag)
-
+            n_jobs = len(jobs)
+            jobs.clear()
+            self.__tag_index.clear()
+            self.__heap.clear()
+            for task in self.__running.values():
+                task.cancel()
+            self.__running.clear()
+            self.__wake()
+            return n_jobs
+
+        tag_index = self.__tag_index
+        jobs_to_delete = select_jobs_by_tag_index(tag_index, tags, any_tag)
         for job in jobs_to_delete:
-            self.delete_job(job)
-
+            del jobs[job]
+            unindex_job_tags(tag_index, job)
+            self.__cancel(job)
+        if not jobs:
+            self.__heap.clear()
+            self.__wake()
         return len(jobs_to_delete)
 
     def get_jobs(
@@ -235,7 +450,7 @@ class Scheduler(BaseScheduler[Job, Callable[..., Coroutine[Any, Any, None]]]):
         """
         if tags is None or tags == set():
             return self.jobs
-        return select_jobs_by_tag(self.jobs, tags, any_tag)
+        return select_jobs_by_tag_index(self.__tag_index, tags, any_tag)
 
     @deprecated(["delay"])
     def cyclic(
@@ -270,11 +485,7 @@ class Scheduler(BaseScheduler[Job, Callable[..., Coroutine[Any, Any, None]]]):
 
             .. include:: ../_assets/aio_kwargs.rst
         """
-        try:
-            tg.check_type(timing, TimingCyclic)
-        except tg.TypeCheckError as err:
-            raise SchedulerError(CYCLIC_TYPE_ERROR_MSG) from err
-        return self.__schedule(job_type=JobType.CYCLIC, timing=timing, handle=handle, **kwargs)
+        return self.__schedule_timed(JobType.CYCLIC, timing, handle, **kwargs)
 
     @deprecated(["delay"])
     def minutely(
@@ -314,11 +525,7 @@ class Scheduler(BaseScheduler[Job, Callable[..., Coroutine[Any, Any, None]]]):
 
             .. include:: ../_assets/aio_kwargs.rst
         """
-        try:
-            tg.check_type(timing, TimingDailyUnion)
-        except tg.TypeCheckError as err:
-            raise SchedulerError(MINUTELY_TYPE_ERROR_MSG) from err
-        return self.__schedule(job_type=JobType.MINUTELY, timing=timing, handle=handle, **kwargs)
+        return self.__schedule_timed(JobType.MINUTELY, timing, handle, **kwargs)
 
     @deprecated(["delay"])
     def hourly(
@@ -358,11 +565,7 @@ class Scheduler(BaseScheduler[Job, Callable[..., Coroutine[Any, Any, None]]]):
 
             .. include:: ../_assets/aio_kwargs.rst
         """
-        try:
-            tg.check_type(timing, TimingDailyUnion)
-        except tg.TypeCheckError as err:
-            raise SchedulerError(HOURLY_TYPE_ERROR_MSG) from err
-        return self.__schedule(job_type=JobType.HOURLY, timing=timing, handle=handle, **kwargs)
+        return self.__schedule_timed(JobType.HOURLY, timing, handle, **kwargs)
 
     @deprecated(["delay"])
     def daily(
@@ -397,11 +600,7 @@ class Scheduler(BaseScheduler[Job, Callable[..., Coroutine[Any, Any, None]]]):
 
             .. include:: ../_assets/aio_kwargs.rst
         """
-        try:
-            tg.check_type(timing, TimingDailyUnion)
-        except tg.TypeCheckError as err:
-            raise SchedulerError(DAILY_TYPE_ERROR_MSG) from err
-        return self.__schedule(job_type=JobType.DAILY, timing=timing, handle=handle, **kwargs)
+        return self.__schedule_timed(JobType.DAILY, timing, handle, **kwargs)
 
     @deprecated(["delay"])
     def weekly(
@@ -438,11 +637,7 @@ class Scheduler(BaseScheduler[Job, Callable[..., Coroutine[Any, Any, None]]]):
 
             .. include:: ../_assets/aio_kwargs.rst
         """
-        try:
-            tg.check_type(timing, TimingWeeklyUnion)
-        except tg.TypeCheckError as err:
-            raise SchedulerError(WEEKLY_TYPE_ERROR_MSG) from err
-        return self.__schedule(job_type=JobType.WEEKLY, timing=timing, handle=handle, **kwargs)
+        return self.__schedule_timed(JobType.WEEKLY, timing, handle, **kwargs)
 
     def once(
         self,
@@ -477,25 +672,22 @@ class Scheduler(BaseScheduler[Job, Callable[..., Coroutine[Any, Any, None]]]):
         Job
             Instance of a scheduled |AioJob|.
         """
-        try:
-            tg.check_type(timing, TimingOnceUnion)
-        except tg.TypeCheckError as err:
-            raise SchedulerError(ONCE_TYPE_ERROR_MSG) from err
-        if isinstance(timing, dt.datetime):
+        job_type, at_datetime = once_job_type(timing)
+        if at_datetime:
             return self.__schedule(
-                job_type=JobType.CYCLIC,
+                job_type=job_type,
                 timing=dt.timedelta(),
                 handle=handle,
                 args=args,
                 kwargs=kwargs,
                 max_attempts=1,
-                tags=set(tags) if tags else set(),
+                tags=tags,
                 alias=alias,
                 delay=False,
                 start=timing,
             )
         return self.__schedule(
-            job_type=JOB_TYPE_MAPPING[type(timing)],
+            job_type=job_type,
             timing=timing,
             handle=handle,
             args=args,
@@ -515,4 +707,4 @@ class Scheduler(BaseScheduler[Job, Callable[..., Coroutine[Any, Any, None]]]):
         set[Job]
             Currently scheduled |AioJob|\ s.
         """
-        return set(self._jobs.keys())
+        return set(self._jobs)
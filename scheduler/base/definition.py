@@ -6,6 +6,7 @@ Author: Jendrik A. Potyka, Fabian A. Preiss
 
 import datetime as dt
 from enum import Enum, auto
+from types import MappingProxyType
 
 from scheduler.base.timingtype import (
     _TimingCyclicList,
@@ -40,37 +41,41 @@ class JobType(Enum):
     WEEKLY = auto()
 
 
-JOB_TYPE_MAPPING = {
-    dt.timedelta: JobType.CYCLIC,
-    dt.time: JobType.DAILY,
-    Monday: JobType.WEEKLY,
-    Tuesday: JobType.WEEKLY,
-    Wednesday: JobType.WEEKLY,
-    Thursday: JobType.WEEKLY,
-    Friday: JobType.WEEKLY,
-    Saturday: JobType.WEEKLY,
-    Sunday: JobType.WEEKLY,
-}
+JOB_TYPE_MAPPING = MappingProxyType(
+    {
+        dt.timedelta: JobType.CYCLIC,
+        dt.time: JobType.DAILY,
+        Monday: JobType.WEEKLY,
+        Tuesday: JobType.WEEKLY,
+        Wednesday: JobType.WEEKLY,
+        Thursday: JobType.WEEKLY,
+        Friday: JobType.WEEKLY,
+        Saturday: JobType.WEEKLY,
+        Sunday: JobType.WEEKLY,
+    }
+)
 
-JOB_TIMING_TYPE_MAPPING = {
-    JobType.CYCLIC: {
-        "type": _TimingCyclicList,
-        "err": CYCLIC_TYPE_ERROR_MSG,
-    },
-    JobType.MINUTELY: {
-        "type": _TimingDailyList,
-        "err": MINUTELY_TYPE_ERROR_MSG,
-    },
-    JobType.HOURLY: {
-        "type": _TimingDailyList,
-        "err": HOURLY_TYPE_ERROR_MSG,
-    },
-    JobType.DAILY: {
-        "type": _TimingDailyList,
-        "err": DAILY_TYPE_ERROR_MSG,
-    },
-    JobType.WEEKLY: {
-        "type": _TimingWeeklyList,
-        "err": WEEKLY_TYPE_ERROR_MSG,
-    },
-}
+JOB_TIMING_TYPE_MAPPING = MappingProxyType(
+    {
+        JobType.CYCLIC: {
+            "type": _TimingCyclicList,
+            "err": CYCLIC_TYPE_ERROR_MSG,
+        },
+        JobType.MINUTELY: {
+            "type": _TimingDailyList,
+            "err": MINUTELY_TYPE_ERROR_MSG,
+        },
+        JobType.HOURLY: {
+            "type": _TimingDailyList,
+            "err": HOURLY_TYPE_ERROR_MSG,
+        },
+        JobType.DAILY: {
+            "type": _TimingDailyList,
+            "err": DAILY_TYPE_ERROR_MSG,
+        },
+        JobType.WEEKLY: {
+            "type": _TimingWeeklyList,
+            "err": WEEKLY_TYPE_ERROR_MSG,
+        },
+    }
+)
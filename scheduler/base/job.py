@@ -7,17 +7,17 @@ Author: Jendrik A. Potyka, Fabian A. Preiss
 from __future__ import annotations
 
 import datetime as dt
+import heapq
 import warnings
 from abc import ABC, abstractmethod
 from logging import Logger
-from typing import Any, Callable, Generic, Optional, TypeVar, cast
+from typing import Any, Callable, Generic, Iterable, NamedTuple, Optional, TypeVar, cast
 
 from scheduler.base.definition import JobType
 from scheduler.base.job_timer import JobTimer
 from scheduler.base.job_util import (
     check_duplicate_effective_timings,
     check_timing_tzinfo,
-    get_pending_timer,
     prettify_timedelta,
     sane_timing_types,
     set_start_check_stop_tzinfo,
@@ -28,16 +28,53 @@ from scheduler.base.timingtype import TimingJobUnion
 T = TypeVar("T", bound=Callable[[], Any])
 
 
+class JobStrParts(NamedTuple):
+    """Readable string fragments of a |BaseJob|."""
+
+    type: str
+    name: str
+    f_args: str
+    at: str
+    tz: str
+    in_: str
+    attempts: str
+    max_attempts: str
+
+
 class BaseJob(ABC, Generic[T]):
     """Abstract definition basic interface for a job class."""
 
+    __slots__ = (
+        "__type",
+        "__timing",
+        "__handle",
+        "__args",
+        "__kwargs",
+        "__max_attempts",
+        "__tags",
+        "__delay",
+        "__start",
+        "__stop",
+        "__skip_missing",
+        "__alias",
+        "__tzinfo",
+        "__mark_delete",
+        "__attempts",
+        "__failed_attempts",
+        "__pending_timer",
+        "__timer_heap",
+        "__repr_static",
+        "__str_static",
+        "__weakref__",
+    )
+
     __type: JobType
     __timing: TimingJobUnion
     __handle: T
     __args: tuple[Any, ...]
     __kwargs: dict[str, Any]
     __max_attempts: int
-    __tags: set[str]
+    __tags: frozenset[str]
     __delay: bool
     __start: Optional[dt.datetime]
     __stop: Optional[dt.datetime]
@@ -50,7 +87,10 @@ class BaseJob(ABC, Generic[T]):
     __attempts: int
     __failed_attempts: int
     __pending_timer: JobTimer
-    __timers: list[JobTimer]
+    # (due datetime, position in timing, timer), the pending timer is the head
+    __timer_heap: list[tuple[dt.datetime, int, JobTimer]]
+    __repr_static: Optional[tuple[str, ...]]
+    __str_static: Optional[tuple[str, str, str, str]]
 
     def __init__(
         self,
@@ -61,7 +101,7 @@ class BaseJob(ABC, Generic[T]):
         args: Optional[tuple[Any, ...]] = None,
         kwargs: Optional[dict[str, Any]] = None,
         max_attempts: int = 0,
-        tags: Optional[set[str]] = None,
+        tags: Optional[Iterable[str]] = None,
         delay: bool = True,
         start: Optional[dt.datetime] = None,
         stop: Optional[dt.datetime] = None,
@@ -85,7 +125,7 @@ class BaseJob(ABC, Generic[T]):
         self.__args = () if args is None else args
         self.__kwargs = {} if kwargs is None else kwargs.copy()
         self.__max_attempts = max_attempts
-        self.__tags = set() if tags is None else tags.copy()
+        self.__tags = frozenset() if tags is None else frozenset(tags)
         self.__delay = delay
         self.__stop = stop
         self.__skip_missing = skip_missing
@@ -97,10 +137,14 @@ class BaseJob(ABC, Generic[T]):
         self.__mark_delete = False
         self.__attempts = 0
         self.__failed_attempts = 0
+        self.__repr_static = None
+        self.__str_static = None
 
         # create JobTimers
-        self.__timers = [JobTimer(job_type, tim, self.__start, skip_missing) for tim in timing]
-        self.__pending_timer = get_pending_timer(self.__timers)
+        timers = [JobTimer(job_type, tim, self.__start, skip_missing) for tim in timing]
+        self.__timer_heap = [(timer.datetime, idx, timer) for idx, timer in enumerate(timers)]
+        heapq.heapify(self.__timer_heap)
+        self.__pending_timer = self.__timer_heap[0][2]
 
         if self.__stop is not None:
             if self.__pending_timer.datetime > self.__stop:
@@ -119,33 +163,48 @@ class BaseJob(ABC, Generic[T]):
             Reference time stamp to which the |BaseJob| calculates
             it's next execution.
         """
+        heap = self.__timer_heap
         if self.__skip_missing:
-            for timer in self.__timers:
-                if (timer.datetime - ref_dt).total_seconds() <= 0:
-                    timer.calc_next_exec(ref_dt)
+            # advance all overdue timers, they are popped in order of their due time
+            overdue = []
+            while heap and heap[0][0] <= ref_dt:
+                _, idx, timer = heapq.heappop(heap)
+                timer.calc_next_exec(ref_dt)
+                overdue.append((timer.datetime, idx, timer))
+            for entry in overdue:
+                heapq.heappush(heap, entry)
         else:
-            self.__pending_timer.calc_next_exec(ref_dt)
-        self.__pending_timer = get_pending_timer(self.__timers)
-        if self.__stop is not None and self.__pending_timer.datetime > self.__stop:
+            _, idx, timer = heap[0]
+            timer.calc_next_exec(ref_dt)
+            heapq.heapreplace(heap, (timer.datetime, idx, timer))
+        pending_dt, _, self.__pending_timer = heap[0]
+        if self.__stop is not None and pending_dt > self.__stop:
             self.__mark_delete = True
 
     def _repr(self) -> tuple[str, ...]:
-        return tuple(
-            repr(elem)
-            for elem in (
-                self.__type,
-                self.__timing,
-                self.__handle,
-                self.__args,
-                self.__kwargs,
-                self.__max_attempts,
-                self.__delay,
-                self.__start,
-                self.__stop,
-                self.__skip_missing,
-                self.__alias,
-                self.tzinfo,
+        # the fields owned by the job never change after construction, so their
+        # representation is only built once; the payload and tzinfo stay live
+        static = self.__repr_static
+        if static is None:
+            static = self.__repr_static = tuple(
+                repr(elem)
+                for elem in (
+                    self.__type,
+                    self.__timing,
+                    self.__handle,
+                    self.__max_attempts,
+                    self.__delay,
+                    self.__start,
+                    self.__stop,
+                    self.__skip_missing,
+                    self.__alias,
+                )
             )
+        return (
+            static[:3]
+            + (repr(self.__args), repr(self.__kwargs))
+            + static[3:]
+            + (repr(self.tzinfo),)
         )
 
     @abstractmethod
@@ -154,28 +213,54 @@ class BaseJob(ABC, Generic[T]):
 
     def _str(
         self,
-    ) -> tuple[str, ...]:
-        """Return the objects relevant for readable string representation."""
-        dt_timedelta = self.timedelta(dt.datetime.now(self.tzinfo))
-        if self.alias is not None:
-            f_args = ""
-        elif hasattr(self.handle, "__code__"):
-            f_args = "(..)" if self.handle.__code__.co_nlocals else "()"
-        else:
-            f_args = "(?)"
-        return (
-            self.type.name if self.max_attempts != 1 else "ONCE",
-            self.handle.__qualname__ if self.alias is None else self.alias,
+        dt_stamp: Optional[dt.datetime] = None,
+    ) -> JobStrParts:
+        """
+        Return the objects relevant for readable string representation.
+
+        Parameters
+        ----------
+        dt_stamp : Optional[datetime.datetime]
+            Reference time of the due time, allows to share a single time stamp
+            between the rows of a |BaseScheduler|'s job table.
+        """
+        if dt_stamp is None:
+            dt_stamp = dt.datetime.now(self.tzinfo)
+        static = self.__str_static
+        if static is None:
+            # type, name, function arguments and max attempts never change
+            handle = self.__handle
+            if self.__alias is not None:
+                f_args = ""
+            elif hasattr(handle, "__code__"):
+                f_args = "(..)" if handle.__code__.co_nlocals else "()"
+            else:
+                f_args = "(?)"
+            static = self.__str_static = (
+                self.__type.name if self.__max_attempts != 1 else "ONCE",
+                handle.__qualname__ if self.__alias is None else self.__alias,
+                f_args,
+                str(float("inf") if self.__max_attempts == 0 else self.__max_attempts),
+            )
+        job_type, name, f_args, max_attempts = static
+        pending_dt = self.datetime
+        return JobStrParts(
+            job_type,
+            name,
             f_args,
-            str(self.datetime)[:19],
-            str(self.datetime.tzname()),
-            prettify_timedelta(dt_timedelta),
-            str(self.attempts),
-            str(float("inf") if self.max_attempts == 0 else self.max_attempts),
+            str(pending_dt)[:19],
+            str(pending_dt.tzname()),
+            prettify_timedelta(self.timedelta(dt_stamp)),
+            str(self.__attempts),
+            max_attempts,
         )
 
     def __str__(self) -> str:
-        return "{0}, {1}{2}, at={3}, tz={4}, in={5}, #{6}/{7}".format(*self._str())
+        parts = self._str()
+        return (
+            f"{parts.type}, {parts.name}{parts.f_args}, at={parts.at}, tz={parts.tz}, "
+            f"in={parts.in_}, #{parts.attempts}/{parts.max_attempts}"
+        )
 
     def timedelta(self, dt_stamp: Optional[dt.datetime] = None) -> dt.timedelta:
         """
@@ -282,16 +367,16 @@ class BaseJob(ABC, Generic[T]):
         return self.__max_attempts
 
     @property
-    def tags(self) -> set[str]:
+    def tags(self) -> frozenset[str]:
         r"""
         Get the tags of a `Job`.
 
         Returns
         -------
-        set[str]
+        frozenset[str]
             The tags of a |BaseJob|.
         """
-        return self.__tags.copy()
+        return self.__tags
 
     @property
     def delay(self) -> bool:
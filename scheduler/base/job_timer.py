@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import datetime as dt
 import threading
-from typing import Optional, cast
+from typing import Callable, Optional
 
 from scheduler.base.definition import JobType
 from scheduler.base.timingtype import TimingJobTimerUnion
@@ -33,6 +33,18 @@ class JobTimer:
         execution and drop older ones.
     """
 
+    __slots__ = (
+        "__lock",
+        "__timing",
+        "__next_exec",
+        "__skip",
+        "__advance",
+        "__next_day",
+    )
+
+    __advance: Callable[[JobTimer, Optional[dt.datetime]], dt.datetime]
+    __next_day: Optional[Callable[[dt.datetime, dt.time], dt.datetime]]
+
     def __init__(
         self,
         job_type: JobType,
@@ -40,13 +52,28 @@ class JobTimer:
         start: dt.datetime,
         skip_missing: bool = False,
     ):
-        self.__lock = threading.RLock()
-        self.__job_type = job_type
+        self.__lock = threading.Lock()
         self.__timing = timing
         self.__next_exec = start
         self.__skip = skip_missing
+        self.__advance, self.__next_day = JobTimer.__calculation(job_type)
         self.calc_next_exec()
 
+    @staticmethod
+    def __calculation(
+        job_type: JobType,
+    ) -> tuple[
+        Callable[[JobTimer, Optional[dt.datetime]], dt.datetime],
+        Optional[Callable[[dt.datetime, dt.time], dt.datetime]],
+    ]:
+        """Select the advance function and the day-like helper of the `job_type`."""
+        # NOTE: the job type of a timer is fixed, so this is only resolved on creation
+        if job_type == JobType.CYCLIC:
+            return JobTimer.__advance_cyclic, None
+        if job_type == JobType.WEEKLY:
+            return JobTimer.__advance_weekly, None
+        return JobTimer.__advance_daylike, JOB_NEXT_DAYLIKE_MAPPING[job_type]
+
     def calc_next_exec(self, ref: Optional[dt.datetime] = None) -> None:
         """
         Generate the next execution `datetime.datetime` stamp.
@@ -56,32 +83,46 @@ class JobTimer:
         ref : Optional[datetime.datetime]
             Datetime reference for scheduling the next execution datetime.
         """
+        # NOTE: the readers don't take the lock, the new stamp is computed locally
+        #       and published with a single assignment
         with self.__lock:
-            if self.__job_type == JobType.CYCLIC:
-                if self.__skip and ref is not None:
-                    self.__next_exec = ref
-                self.__next_exec = self.__next_exec + cast(dt.timedelta, self.__timing)
-                return
-
-            if self.__job_type == JobType.WEEKLY:
-                self.__timing = cast(Weekday, self.__timing)
-                if self.__timing.time.tzinfo:
-                    self.__next_exec = self.__next_exec.astimezone(self.__timing.time.tzinfo)
-                self.__next_exec = next_weekday_time_occurrence(
-                    self.__next_exec, self.__timing, self.__timing.time
-                )
-
-            else:  # self.__job_type in JOB_NEXT_DAYLIKE_MAPPING:
-                self.__timing = cast(dt.time, self.__timing)
-                if self.__next_exec.tzinfo:
-                    self.__next_exec = self.__next_exec.astimezone(self.__timing.tzinfo)
-                self.__next_exec = JOB_NEXT_DAYLIKE_MAPPING[self.__job_type](
-                    self.__next_exec, self.__timing
-                )
-
-            if self.__skip and ref is not None and self.__next_exec < ref:
-                self.__next_exec = ref
-                self.calc_next_exec()
+            self.__next_exec = self.__advance(self, ref)
+
+    def __advance_cyclic(self, ref: Optional[dt.datetime]) -> dt.datetime:
+        """Get the next cyclic execution."""
+        period: dt.timedelta = self.__timing  # type: ignore[assignment]
+        if self.__skip and ref is not None:
+            return ref + period
+        return self.__next_exec + period
+
+    def __advance_weekly(self, ref: Optional[dt.datetime]) -> dt.datetime:
+        """Get the next weekly execution."""
+        next_exec = self.__next_weekly(self.__next_exec)
+        if self.__skip and ref is not None and next_exec < ref:
+            next_exec = self.__next_weekly(ref)
+        return next_exec
+
+    def __advance_daylike(self, ref: Optional[dt.datetime]) -> dt.datetime:
+        """Get the next minutely, hourly or daily execution."""
+        next_exec = self.__next_daylike(self.__next_exec)
+        if self.__skip and ref is not None and next_exec < ref:
+            next_exec = self.__next_daylike(ref)
+        return next_exec
+
+    def __next_weekly(self, reference: dt.datetime) -> dt.datetime:
+        """Get the next weekly execution following the `reference`."""
+        weekday: Weekday = self.__timing  # type: ignore[assignment]
+        tzinfo = weekday.time.tzinfo
+        if tzinfo:
+            reference = reference.astimezone(tzinfo)
+        return next_weekday_time_occurrence(reference, weekday, weekday.time)
+
+    def __next_daylike(self, reference: dt.datetime) -> dt.datetime:
+        """Get the next minutely, hourly or daily execution following the `reference`."""
+        time: dt.time = self.__timing  # type: ignore[assignment]
+        if reference.tzinfo:
+            reference = reference.astimezone(time.tzinfo)
+        return self.__next_day(reference, time)  # type: ignore[misc]
 
     @property
     def datetime(self) -> dt.datetime:
@@ -93,8 +134,7 @@ class JobTimer:
         datetime.datetime
             Execution `datetime.datetime` stamp.
         """
-        with self.__lock:
-            return self.__next_exec
+        return self.__next_exec
 
     def timedelta(self, dt_stamp: dt.datetime) -> dt.timedelta:
         """
@@ -111,5 +151,4 @@ class JobTimer:
         datetime.timedelta
             `datetime.timedelta` to the execution.
         """
-        with self.__lock:
-            return self.__next_exec - dt_stamp
+        return self.__next_exec - dt_stamp
@@ -9,10 +9,7 @@ from __future__ import annotations
 import datetime as dt
 from typing import Optional, cast
 
-import typeguard as tg
-
 from scheduler.base.definition import JOB_TIMING_TYPE_MAPPING, JobType
-from scheduler.base.job_timer import JobTimer
 from scheduler.base.timingtype import TimingJobUnion
 from scheduler.error import SchedulerError
 from scheduler.message import (
@@ -24,6 +21,15 @@ from scheduler.message import (
 from scheduler.trigger.core import Weekday
 from scheduler.util import are_times_unique, are_weekday_times_unique
 
+# expected type of the elements in a standardized `timing` list
+_TIMING_ELEMENT_TYPES: dict[JobType, type] = {
+    JobType.CYCLIC: dt.timedelta,
+    JobType.MINUTELY: dt.time,
+    JobType.HOURLY: dt.time,
+    JobType.DAILY: dt.time,
+    JobType.WEEKLY: Weekday,
+}
+
 
 def prettify_timedelta(timedelta: dt.timedelta) -> str:
     """
@@ -39,24 +45,15 @@ def prettify_timedelta(timedelta: dt.timedelta) -> str:
     str
         Human readable string representation rounded to seconds
     """
-    seconds = timedelta.total_seconds()
-    if seconds < 0:
-        res = f"-{-timedelta}"
-    else:
-        res = str(timedelta)
-    return res.split(",")[0].split(".")[0]
-
-
-def get_pending_timer(timers: list[JobTimer]) -> JobTimer:
-    """Get the the timer with the largest overdue time."""
-    unsorted_timer_datetimes: dict[JobTimer, dt.datetime] = {}
-    for timer in timers:
-        unsorted_timer_datetimes[timer] = timer.datetime
-    sorted_timers = sorted(
-        unsorted_timer_datetimes,
-        key=unsorted_timer_datetimes.get,  # type: ignore
-    )
-    return sorted_timers[0]
+    sign = ""
+    if timedelta.days < 0:
+        sign = "-"
+        timedelta = -timedelta
+    days = timedelta.days
+    if days:
+        return f"{sign}{days} day" if days == 1 else f"{sign}{days} days"
+    seconds = timedelta.seconds
+    return f"{sign}{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
 
 
 def sane_timing_types(job_type: JobType, timing: TimingJobUnion) -> None:
@@ -72,16 +69,16 @@ def sane_timing_types(job_type: JobType, timing: TimingJobUnion) -> None:
 
     Raises
     ------
-    TypeError
+    SchedulerError
         If the `timing` object has the wrong `Type` for a specific `JobType`.
     """
-    try:
-        tg.check_type(timing, JOB_TIMING_TYPE_MAPPING[job_type]["type"])
-        if job_type == JobType.CYCLIC:
-            if not len(timing) == 1:
-                raise TypeError
-    except TypeError as err:
-        raise SchedulerError(JOB_TIMING_TYPE_MAPPING[job_type]["err"]) from err
+    element_type = _TIMING_ELEMENT_TYPES[job_type]
+    if (
+        not isinstance(timing, list)
+        or not all(isinstance(element, element_type) for element in timing)
+        or (job_type is JobType.CYCLIC and len(timing) != 1)
+    ):
+        raise SchedulerError(JOB_TIMING_TYPE_MAPPING[job_type]["err"])
 
 
 def standardize_timing_format(job_type: JobType, timing: TimingJobUnion) -> TimingJobUnion:
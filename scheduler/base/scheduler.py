@@ -9,6 +9,7 @@ from abc import ABC, abstractmethod
 from collections.abc import Iterable
 from functools import wraps
 from logging import Logger, getLogger
+from operator import attrgetter
 from typing import Any, Callable, Generic, List, Optional, TypeVar
 
 from scheduler.base.job import BaseJobType
@@ -29,9 +30,11 @@ from scheduler.base.timingtype import (
 
 LOGGER = getLogger("scheduler")
 
+_DUE_KEY = attrgetter("datetime")
+
 
 def select_jobs_by_tag(
-    jobs: set[BaseJobType],
+    jobs: Iterable[BaseJobType],
     tags: set[str],
     any_tag: bool,
 ) -> set[BaseJobType]:
@@ -40,8 +43,8 @@ def select_jobs_by_tag(
 
     Parameters
     ----------
-    jobs : set[BaseJob]
-        Unfiltered set of |BaseJob|\ s.
+    jobs : Iterable[BaseJob]
+        Unfiltered |BaseJob|\ s.
     tags : set[str]
         Tags to filter |BaseJob|\ s.
     any_tag : bool
@@ -53,9 +56,113 @@ def select_jobs_by_tag(
     set[BaseJob]
         Selected |BaseJob|\ s.
     """
+    if not tags:
+        # no tag is shared by any job, while all jobs carry the empty set of tags
+        return set() if any_tag else set(jobs)
+    if len(tags) == 1:
+        # NOTE: any and all tags coincide for a single tag
+        (tag,) = tags
+        return {job for job in jobs if tag in job.tags}
+    if len(tags) == 2 and not any_tag:
+        # two membership tests are cheaper than a subset test of a pair
+        tag0, tag1 = tags
+        return {job for job in jobs if tag0 in job.tags and tag1 in job.tags}
+    tag_set = frozenset(tags)
     if any_tag:
-        return {job for job in jobs if tags & job.tags}
-    return {job for job in jobs if tags <= job.tags}
+        return {job for job in jobs if not tag_set.isdisjoint(job.tags)}
+    return {job for job in jobs if tag_set.issubset(job.tags)}
+
+
+def index_job_tags(tag_index: dict[str, set[BaseJobType]], job: BaseJobType) -> None:
+    r"""
+    Add a |BaseJob| to the `tag_index` under each of its tags.
+
+    Parameters
+    ----------
+    tag_index : dict[str, set[BaseJob]]
+        Scheduled |BaseJob|\ s by each of their tags.
+    job : BaseJob
+        |BaseJob| to add.
+    """
+    for tag in job.tags:
+        tag_index.setdefault(tag, set()).add(job)
+
+
+def unindex_job_tags(tag_index: dict[str, set[BaseJobType]], job: BaseJobType) -> None:
+    r"""
+    Remove a |BaseJob| from the `tag_index`, dropping tags without |BaseJob|\ s.
+
+    Parameters
+    ----------
+    tag_index : dict[str, set[BaseJob]]
+        Scheduled |BaseJob|\ s by each of their tags.
+    job : BaseJob
+        |BaseJob| to remove.
+    """
+    for tag in job.tags:
+        tagged = tag_index[tag]
+        tagged.discard(job)
+        if not tagged:
+            del tag_index[tag]
+
+
+def select_jobs_by_tag_index(
+    tag_index: dict[str, set[BaseJobType]],
+    tags: set[str],
+    any_tag: bool,
+) -> set[BaseJobType]:
+    r"""
+    Select |BaseJob|\ s by matching `tags` via a tag index.
+
+    Gives the same result as :func:`select_jobs_by_tag` for the indexed |BaseJob|\ s,
+    but only touches the |BaseJob|\ s carrying one of the `tags`.
+
+    Parameters
+    ----------
+    tag_index : dict[str, set[BaseJob]]
+        Scheduled |BaseJob|\ s by each of their tags.
+    tags : set[str]
+        Tags to filter |BaseJob|\ s, must not be empty.
+    any_tag : bool
+        False: To match a |BaseJob| all tags have to match.
+        True: To match a |BaseJob| at least one tag has to match.
+
+    Returns
+    -------
+    set[BaseJob]
+        Selected |BaseJob|\ s.
+    """
+    if any_tag:
+        return set().union(*(tag_index.get(tag, ()) for tag in tags))
+    tagged: list[set[BaseJobType]] = []
+    for tag in tags:
+        if tag not in tag_index:
+            return set()
+        tagged.append(tag_index[tag])
+    # start with the smallest candidate set
+    tagged.sort(key=len)
+    return tagged[0].intersection(*tagged[1:])
+
+
+def sort_jobs_by_due(jobs: Iterable[BaseJobType]) -> list[BaseJobType]:
+    r"""
+    Sort |BaseJob|\ s by their planned execution `datetime.datetime`.
+
+    Equivalent to ``sorted(jobs)``, but the `datetime.datetime` stamps are only
+    fetched once per |BaseJob| and compared directly instead of calling
+    ``BaseJob.__lt__`` for every comparison.
+
+    Parameters
+    ----------
+    jobs : Iterable[BaseJob]
+        Unsorted |BaseJob|\ s.
+
+    Returns
+    -------
+    list[BaseJob]
+        |BaseJob|\ s ordered by their next execution.
+    """
+    return sorted(jobs, key=_DUE_KEY)
 
 
 def deprecated(fields: List[str]) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
@@ -76,9 +183,14 @@ def deprecated(fields: List[str]) -> Callable[[Callable[..., Any]], Callable[...
     Calling `some_function(new_arg=5, old_arg=3)` generates a deprecation warning for using 'old_arg'.
     """
 
+    fields_set = frozenset(fields)
+
     def wrapper(func: Callable[..., Any]) -> Callable[..., Any]:
         @wraps(func)
         def real_wrapper(*args: tuple[Any, ...], **kwargs: dict[str, Any]) -> Any:
+            if fields_set.isdisjoint(kwargs):
+                # common case, none of the deprecated arguments is used
+                return func(*args, **kwargs)
             for f in fields:
                 if f in kwargs and kwargs[f] is not None:
                     # keep it in kwargs
@@ -109,6 +221,8 @@ class BaseScheduler(
     Author: Jendrik A. Potyka, Fabian A. Preiss
     """
 
+    __slots__ = ("_logger", "__weakref__")
+
     _logger: Logger
 
     def __init__(self, logger: Optional[Logger] = None) -> None:
@@ -5,16 +5,31 @@ Author: Jendrik A. Potyka, Fabian A. Preiss
 """
 
 import datetime as dt
-from typing import Optional, Union, cast
+import os
+from typing import Any, Callable, Optional, Union
 
+from scheduler.base.definition import JOB_TYPE_MAPPING, JobType
 from scheduler.base.job import BaseJobType
 from scheduler.base.timingtype import (
     TimingCyclic,
     TimingDailyUnion,
     TimingJobUnion,
+    TimingOnceUnion,
     TimingWeeklyUnion,
 )
 from scheduler.error import SchedulerError
+from scheduler.message import (
+    CYCLIC_TYPE_ERROR_MSG,
+    DAILY_TYPE_ERROR_MSG,
+    HOURLY_TYPE_ERROR_MSG,
+    MINUTELY_TYPE_ERROR_MSG,
+    ONCE_TYPE_ERROR_MSG,
+    WEEKLY_TYPE_ERROR_MSG,
+)
+from scheduler.trigger.core import Weekday
+
+# Additionally run the `typeguard` checks on the scheduling input, for debugging purposes
+STRICT_TYPECHECK = bool(os.environ.get("SCHEDULER_STRICT_TYPECHECK"))
 
 
 def str_cutoff(string: str, max_length: int, cut_tail: bool = False) -> str:
@@ -38,14 +53,15 @@ def str_cutoff(string: str, max_length: int, cut_tail: bool = False) -> str:
     str
         Resulting string
     """
+    # common case first, the string fits into a valid `max_length`
+    if max_length > 0 and len(string) <= max_length:
+        return string
+
     if max_length < 1:
         raise ValueError("max_length < 1 not allowed")
 
-    if len(string) > max_length:
-        pos = max_length - 1
-        return string[:pos] + "#" if cut_tail else "#" + string[-pos:]
-
-    return string
+    pos = max_length - 1
+    return string[:pos] + "#" if cut_tail else "#" + string[-pos:]
 
 
 def check_tzname(tzinfo: Optional[dt.tzinfo]) -> Optional[str]:
@@ -64,12 +80,126 @@ def create_job_instance(
     **kwargs,
 ) -> BaseJobType:
     """Create a job instance from the given input parameters."""
-    if not isinstance(timing, list):
-        timing_list = cast(TimingJobUnion, [timing])
-    else:
-        timing_list = cast(TimingJobUnion, timing)
-
+    timing_list: TimingJobUnion = (
+        timing if isinstance(timing, list) else [timing]  # type: ignore[assignment]
+    )
     return job_class(
         timing=timing_list,
         **kwargs,
     )
+
+
+def _is_timing_cyclic(timing: Any) -> bool:
+    return isinstance(timing, dt.timedelta)
+
+
+def _is_timing_daily(timing: Any) -> bool:
+    if isinstance(timing, list):
+        return all(isinstance(elem, dt.time) for elem in timing)
+    return isinstance(timing, dt.time)
+
+
+def _is_timing_weekly(timing: Any) -> bool:
+    if isinstance(timing, list):
+        return all(isinstance(elem, Weekday) for elem in timing)
+    return isinstance(timing, Weekday)
+
+
+# `JobType` of a oneshot `timing` by its type and whether it is a `datetime.datetime` start
+ONCE_JOB_TYPES: dict[type, tuple[JobType, bool]] = {
+    dt.datetime: (JobType.CYCLIC, True),
+    **{timing_type: (job_type, False) for timing_type, job_type in JOB_TYPE_MAPPING.items()},
+}
+
+
+def once_job_type(timing: Any) -> tuple[JobType, bool]:
+    """
+    Resolve the `JobType` of a oneshot |BaseJob| from its `timing`.
+
+    Parameters
+    ----------
+    timing : Any
+        The `timing` argument of a oneshot |BaseJob|.
+
+    Returns
+    -------
+    tuple[JobType, bool]
+        The `JobType` and whether the `timing` is a `datetime.datetime`.
+
+    Raises
+    ------
+    SchedulerError
+        If the `timing` has the wrong type.
+    """
+    try:
+        resolved = ONCE_JOB_TYPES[type(timing)]
+    except KeyError:
+        # subclasses of the supported types, e.g. third party datetime implementations
+        for timing_type, type_info in ONCE_JOB_TYPES.items():
+            if isinstance(timing, timing_type):
+                resolved = type_info
+                break
+        else:
+            raise SchedulerError(ONCE_TYPE_ERROR_MSG) from None
+    if STRICT_TYPECHECK:
+        _strict_check_type(timing, TimingOnceUnion, ONCE_TYPE_ERROR_MSG)
+    return resolved
+
+
+TIMING_VALIDATORS: dict[JobType, Callable[[Any], bool]] = {
+    JobType.CYCLIC: _is_timing_cyclic,
+    JobType.MINUTELY: _is_timing_daily,
+    JobType.HOURLY: _is_timing_daily,
+    JobType.DAILY: _is_timing_daily,
+    JobType.WEEKLY: _is_timing_weekly,
+}
+
+# expected timing type and error message of the periodic scheduling methods
+TIMING_CHECKS: dict[JobType, tuple[Any, str]] = {
+    JobType.CYCLIC: (TimingCyclic, CYCLIC_TYPE_ERROR_MSG),
+    JobType.MINUTELY: (TimingDailyUnion, MINUTELY_TYPE_ERROR_MSG),
+    JobType.HOURLY: (TimingDailyUnion, HOURLY_TYPE_ERROR_MSG),
+    JobType.DAILY: (TimingDailyUnion, DAILY_TYPE_ERROR_MSG),
+    JobType.WEEKLY: (TimingWeeklyUnion, WEEKLY_TYPE_ERROR_MSG),
+}
+
+
+def check_timing(
+    timing: Any,
+    validator: Callable[[Any], bool],
+    timing_type: Any,
+    err_msg: str,
+) -> None:
+    """
+    Raise if `timing` is not a valid scheduling input.
+
+    Parameters
+    ----------
+    timing : Any
+        The `timing` argument passed to the `Scheduler`.
+    validator : Callable[[Any], bool]
+        Fast check of the `timing`, see ``TIMING_VALIDATORS``.
+    timing_type : Any
+        The expected type, only used by `typeguard` with ``STRICT_TYPECHECK``.
+    err_msg : str
+        Message of the raised error.
+
+    Raises
+    ------
+    SchedulerError
+        If the `timing` has the wrong type.
+    """
+    if not validator(timing):
+        raise SchedulerError(err_msg)
+    if STRICT_TYPECHECK:
+        _strict_check_type(timing, timing_type, err_msg)
+
+
+def _strict_check_type(timing: Any, timing_type: Any, err_msg: str) -> None:
+    # typeguard is only needed for the debugging checks
+    import typeguard as tg  # pylint: disable=import-outside-toplevel
+
+    try:
+        tg.check_type(timing, timing_type)
+    except tg.TypeCheckError as err:
+        raise SchedulerError(err_msg) from err
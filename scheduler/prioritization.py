@@ -7,10 +7,13 @@ functions have to be of type ``Callable[[float, Job, int, int], float]``.
 Author: Jendrik A. Potyka, Fabian A. Preiss
 """
 
+from __future__ import annotations
+
 import random
+from typing import TYPE_CHECKING
 
-from scheduler.base.job import BaseJobType
-from scheduler.threading.job import Job
+if TYPE_CHECKING:  # pragma: no cover
+    from scheduler.threading.job import Job
 
 
 def constant_weight_prioritization(
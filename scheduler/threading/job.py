@@ -7,7 +7,7 @@ Author: Jendrik A. Potyka, Fabian A. Preiss
 import datetime as dt
 import threading
 from logging import Logger
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterable, Optional
 
 from scheduler.base.definition import JobType
 from scheduler.base.job import BaseJob
@@ -33,7 +33,7 @@ class Job(BaseJob[Callable[..., None]]):
     max_attempts : Optional[int]
         Number of times the |Job| will be executed where ``0 <=> inf``.
         A |Job| with no free attempt will be deleted.
-    tags : Optional[set[str]]
+    tags : Optional[Iterable[str]]
         The tags of the |Job|.
     delay : Optional[bool]
         *Deprecated*: If ``True`` wait with the execution for the next scheduled time.
@@ -60,6 +60,8 @@ class Job(BaseJob[Callable[..., None]]):
         Instance of a scheduled |Job|.
     """
 
+    __slots__ = ("__weight", "__lock")
+
     __weight: float
     __lock: threading.RLock
 
@@ -72,7 +74,7 @@ class Job(BaseJob[Callable[..., None]]):
         args: Optional[tuple[Any, ...]] = None,
         kwargs: Optional[dict[str, Any]] = None,
         max_attempts: int = 0,
-        tags: Optional[set[str]] = None,
+        tags: Optional[Iterable[str]] = None,
         delay: bool = True,
         start: Optional[dt.datetime] = None,
         stop: Optional[dt.datetime] = None,
@@ -5,17 +5,33 @@ Author: Jendrik A. Potyka, Fabian A. Preiss
 """
 
 import datetime as dt
+import heapq
+import itertools
 import queue
 import threading
+import time
 from collections.abc import Iterable
 from logging import Logger
 from typing import Any, Callable, Optional
 
-import typeguard as tg
-
-from scheduler.base.definition import JOB_TYPE_MAPPING, JobType
-from scheduler.base.scheduler import BaseScheduler, deprecated, select_jobs_by_tag
-from scheduler.base.scheduler_util import check_tzname, create_job_instance, str_cutoff
+from scheduler.base.definition import JobType
+from scheduler.base.scheduler import (
+    BaseScheduler,
+    deprecated,
+    index_job_tags,
+    select_jobs_by_tag_index,
+    sort_jobs_by_due,
+    unindex_job_tags,
+)
+from scheduler.base.scheduler_util import (
+    TIMING_CHECKS,
+    TIMING_VALIDATORS,
+    check_timing,
+    check_tzname,
+    create_job_instance,
+    once_job_type,
+    str_cutoff,
+)
 from scheduler.base.timingtype import (
     TimingCyclic,
     TimingDailyUnion,
@@ -23,18 +39,19 @@ from scheduler.base.timingtype import (
     TimingWeeklyUnion,
 )
 from scheduler.error import SchedulerError
-from scheduler.message import (
-    CYCLIC_TYPE_ERROR_MSG,
-    DAILY_TYPE_ERROR_MSG,
-    HOURLY_TYPE_ERROR_MSG,
-    MINUTELY_TYPE_ERROR_MSG,
-    ONCE_TYPE_ERROR_MSG,
-    TZ_ERROR_MSG,
-    WEEKLY_TYPE_ERROR_MSG,
+from scheduler.message import TZ_ERROR_MSG
+from scheduler.prioritization import (
+    constant_weight_prioritization,
+    linear_priority_function,
 )
-from scheduler.prioritization import linear_priority_function
 from scheduler.threading.job import Job
 
+# priority functions that only prioritize due jobs, which allows to skip all other jobs
+_DUE_PRIORITY_FUNCTIONS = (linear_priority_function, constant_weight_prioritization)
+# NOTE: like in the asyncio scheduler, the heap is only rebuilt if there is a
+#       significant number of entries belonging to deleted or rescheduled jobs
+_MIN_STALE_ENTRIES = 100
+
 
 def _exec_job_worker(que: queue.Queue[Job], logger: Logger) -> None:
     running = True
@@ -72,13 +89,33 @@ class Scheduler(BaseScheduler[Job, Callable[..., None]]):
         on the time it is overdue and its respective weight. Defaults to a linear
         priority function.
     jobs : set[Job]
-        A collection of job instances.
+        A collection of job instances, the collection is copied.
     n_threads : int
         The number of worker threads. 0 for unlimited, default 1.
     logger : Optional[logging.Logger]
         A custom Logger instance.
+    now_resolution : float
+        Reuse the reference time of the previous call of `Scheduler.exec_jobs()`
+        if it is less than `now_resolution` seconds old. Defaults to 0, which
+        disables the reuse.
     """
 
+    __slots__ = (
+        "__max_exec",
+        "__tzinfo",
+        "__priority_function",
+        "__jobs_lock",
+        "__jobs",
+        "__tag_index",
+        "__due_heap",
+        "__due_seq",
+        "__seq",
+        "__n_threads",
+        "__tz_str",
+        "__now_resolution",
+        "__last_now",
+    )
+
     def __init__(
         self,
         *,
@@ -91,40 +128,52 @@ class Scheduler(BaseScheduler[Job, Callable[..., None]]):
         jobs: Optional[Iterable[Job]] = None,
         n_threads: int = 1,
         logger: Optional[Logger] = None,
+        now_resolution: float = 0,
     ):
         super().__init__(logger=logger)
         self.__max_exec = max_exec
         self.__tzinfo = tzinfo
         self.__priority_function = priority_function
         self.__jobs_lock = threading.RLock()
-        if not jobs:
-            self.__jobs = set()
-        elif isinstance(jobs, set):
-            self.__jobs = jobs
-        else:
-            self.__jobs = set(jobs)
-
+        # NOTE: the given jobs are copied, the tag index and the due heap are built from
+        #       them once and would miss jobs added to a shared set later on
+        self.__jobs = set(jobs) if jobs else set()
+
+        # scheduled jobs by each of their tags
+        self.__tag_index: dict[str, set[Job]] = {}
+        # min-heap of (due datetime, sequence number, job) entries, an entry is stale
+        # unless its sequence number is the one of the job in `__due_seq`
+        self.__due_heap: list[tuple[dt.datetime, int, Job]] = []
+        self.__due_seq: dict[Job, int] = {}
+        self.__seq = itertools.count()
+        if any(job._tzinfo != tzinfo for job in self.__jobs):
+            raise SchedulerError(TZ_ERROR_MSG)
         for job in self.__jobs:
-            if job._tzinfo != self.__tzinfo:
-                raise SchedulerError(TZ_ERROR_MSG)
+            index_job_tags(self.__tag_index, job)
+            self.__push(job)
 
         self.__n_threads = n_threads
         self.__tz_str = check_tzname(tzinfo=tzinfo)
+        self.__now_resolution = now_resolution
+        # (monotonic time, reference datetime) of the last call of `exec_jobs`
+        self.__last_now: Optional[tuple[float, dt.datetime]] = None
 
     def __repr__(self) -> str:
         with self.__jobs_lock:
+            params = [
+                repr(elem)
+                for elem in (
+                    self.__max_exec,
+                    self.__tzinfo,
+                    self.__priority_function,
+                )
+            ]
+            # the reuse of the reference time is opt-in, only show a set resolution
+            if self.__now_resolution:
+                params.append(f"now_resolution={self.__now_resolution!r}")
             return "scheduler.Scheduler({0}, jobs={{{1}}})".format(
-                ", ".join(
-                    (
-                        repr(elem)
-                        for elem in (
-                            self.__max_exec,
-                            self.__tzinfo,
-                            self.__priority_function,
-                        )
-                    )
-                ),
-                ", ".join([repr(job) for job in sorted(self.jobs)]),
+                ", ".join(params),
+                ", ".join([repr(job) for job in sort_jobs_by_due(self.jobs)]),
             )
 
     def __str__(self) -> str:
@@ -153,23 +202,24 @@ class Scheduler(BaseScheduler[Job, Callable[..., None]]):
                 form = form[:3] + form[4:]
 
             fstring = " ".join(form) + "\n"
-            job_table = fstring.format(*c_name) + fstring.format(
-                *("-" * width for width in c_width)
-            )
-            for job in sorted(self.jobs):
-                row = job._str()
-                entries = (
-                    row[0],
-                    str_cutoff(row[1] + row[2], c_width[1], False),
-                    row[3],
-                    str_cutoff(row[4] or "", c_width[3], False),
-                    str_cutoff(row[5], c_width[4], True),
-                    str_cutoff(f"{row[6]}/{row[7]}", c_width[5], True),
-                    str_cutoff(f"{job.weight}", c_width[6], True),
+            fmt_row = fstring.format
+            rows = [fmt_row(*c_name), fmt_row(*("-" * width for width in c_width))]
+            dt_stamp = dt.datetime.now(self.__tzinfo)
+            for job in sort_jobs_by_due(self.jobs):
+                row = job._str(dt_stamp)
+                rows.append(
+                    fmt_row(
+                        row.type,
+                        str_cutoff(row.name + row.f_args, c_width[1], False),
+                        row.at,
+                        str_cutoff(row.tz, c_width[3], False),
+                        str_cutoff(row.in_, c_width[4], True),
+                        str_cutoff(f"{row.attempts}/{row.max_attempts}", c_width[5], True),
+                        str_cutoff(f"{job.weight}", c_width[6], True),
+                    )
                 )
-                job_table += fstring.format(*entries)
 
-            return scheduler_headings + job_table
+            return scheduler_headings + "".join(rows)
 
     def __headings(self) -> list[str]:
         with self.__jobs_lock:
@@ -190,8 +240,50 @@ class Scheduler(BaseScheduler[Job, Callable[..., None]]):
         if job.has_attempts_remaining:
             with self.__jobs_lock:
                 self.__jobs.add(job)
+                index_job_tags(self.__tag_index, job)
+                self.__push(job)
         return job
 
+    def __push(self, job: Job) -> None:
+        """Add the next execution of a `Job` to the heap, the caller holds the lock."""
+        seq = next(self.__seq)
+        self.__due_seq[job] = seq
+        heap = self.__due_heap
+        heapq.heappush(heap, (job.datetime, seq, job))
+
+        n_stale = len(heap) - len(self.__due_seq)
+        if n_stale > _MIN_STALE_ENTRIES and 2 * n_stale > len(heap):
+            due_seq = self.__due_seq
+            heap[:] = [entry for entry in heap if due_seq.get(entry[2]) == entry[1]]
+            heapq.heapify(heap)
+
+    def __due_entries(self, ref_dt: dt.datetime) -> list[tuple[dt.datetime, int, Job]]:
+        """Get the live heap entries that are due at `ref_dt`, the caller holds the lock."""
+        heap = self.__due_heap
+        due_seq = self.__due_seq
+        entries = []
+        while heap and heap[0][0] <= ref_dt:
+            entry = heapq.heappop(heap)
+            if due_seq.get(entry[2]) == entry[1]:
+                entries.append(entry)
+        # stale entries are dropped, the live ones stay until their job is rescheduled,
+        # so concurrent calls see the same due jobs as the full scan would
+        for entry in entries:
+            heapq.heappush(heap, entry)
+        return entries
+
+    def __schedule_timed(
+        self,
+        job_type: JobType,
+        timing: Any,
+        handle: Callable[..., None],
+        **kwargs,
+    ) -> Job:
+        """Check the `timing` of a periodic `Job` and schedule it."""
+        timing_type, err_msg = TIMING_CHECKS[job_type]
+        check_timing(timing, TIMING_VALIDATORS[job_type], timing_type, err_msg)
+        return self.__schedule(job_type=job_type, timing=timing, handle=handle, **kwargs)
+
     def __exec_jobs(self, jobs: list[Job], ref_dt: dt.datetime) -> int:
         n_jobs = len(jobs)
 
@@ -212,8 +304,27 @@ class Scheduler(BaseScheduler[Job, Callable[..., None]]):
 
         for job in jobs:
             job._calc_next_exec(ref_dt)  # pylint: disable=protected-access
-            if not job.has_attempts_remaining:
-                self.delete_job(job)
+        # update the bookkeeping of all executed jobs under a single lock acquisition,
+        # jobs without remaining attempts are removed from the job set in one go
+        deleted_finished = False
+        with self.__jobs_lock:
+            scheduled = self.__jobs
+            finished = []
+            for job in jobs:
+                if job.has_attempts_remaining:
+                    if job in scheduled:
+                        self.__push(job)
+                elif job in scheduled:
+                    unindex_job_tags(self.__tag_index, job)
+                    self.__due_seq.pop(job, None)
+                    finished.append(job)
+                else:
+                    # like `delete_job`, a finished job can't be deleted if it was
+                    # already deleted during its execution
+                    deleted_finished = True
+            scheduled.difference_update(finished)
+        if deleted_finished:
+            raise SchedulerError("An unscheduled Job can not be deleted!")
 
         return n_jobs
 
@@ -241,32 +352,70 @@ class Scheduler(BaseScheduler[Job, Callable[..., None]]):
         int
             Number of executed |Job|\ s.
         """
-        ref_dt = dt.datetime.now(tz=self.__tzinfo)
+        ref_dt = self.__now()
 
         if force_exec_all:
             return self.__exec_jobs(list(self.__jobs), ref_dt)
+
+        if self.__priority_function in _DUE_PRIORITY_FUNCTIONS:
+            return self.__exec_due_jobs(ref_dt)
+
         #  collect the current priority for all jobs
+        priorities: list[float] = []
+        priority_function = self.__priority_function
+        max_exec = self.__max_exec
+        with self.__jobs_lock:
+            jobs = list(self.__jobs)
+            n_jobs = len(jobs)
+            for job in jobs:
+                delta_seconds = job.timedelta(ref_dt).total_seconds()
+                priorities.append(priority_function(-delta_seconds, job, max_exec, n_jobs))
+        return self.__exec_jobs(self.__select_by_priority(jobs, priorities), ref_dt)
 
-        job_priority: dict[Job, float] = {}
-        n_jobs = len(self.__jobs)
+    def __now(self) -> dt.datetime:
+        """Get the reference time, reused within the `now_resolution` of the `Scheduler`."""
+        if self.__now_resolution <= 0:
+            return dt.datetime.now(tz=self.__tzinfo)
+        with self.__jobs_lock:
+            mono = time.monotonic()
+            last_now = self.__last_now
+            if last_now is not None and mono - last_now[0] < self.__now_resolution:
+                return last_now[1]
+            ref_dt = dt.datetime.now(tz=self.__tzinfo)
+            self.__last_now = (mono, ref_dt)
+            return ref_dt
+
+    def __select_by_priority(self, jobs: list[Job], priorities: list[float]) -> list[Job]:
+        r"""
+        Get the `Job`\ s to execute in order of their priority.
+
+        `jobs` and `priorities` are parallel lists, the sort keys are looked up by index.
+        """
+        # filter jobs by priority greater zero
+        due_idx = [idx for idx, priority in enumerate(priorities) if priority > 0]
+        if len(due_idx) <= 1:
+            return [jobs[idx] for idx in due_idx]
+        # sort the jobs by priority, only the top max_exec jobs are needed if limited
+        if self.__max_exec == 0:
+            order = sorted(due_idx, key=priorities.__getitem__, reverse=True)
+        else:
+            order = heapq.nlargest(self.__max_exec, due_idx, key=priorities.__getitem__)
+        return [jobs[idx] for idx in order]
+
+    def __exec_due_jobs(self, ref_dt: dt.datetime) -> int:
+        r"""Execute the `Job`\ s by priority, only considering the due `Job`\ s of the heap."""
+        jobs: list[Job] = []
+        priorities: list[float] = []
+        priority_function = self.__priority_function
+        max_exec = self.__max_exec
         with self.__jobs_lock:
-            for job in self.__jobs:
+            entries = self.__due_entries(ref_dt)
+            n_jobs = len(self.__jobs)
+            for _, _, job in entries:
                 delta_seconds = job.timedelta(ref_dt).total_seconds()
-                job_priority[job] = self.__priority_function(
-                    -delta_seconds,
-                    job,
-                    self.__max_exec,
-                    n_jobs,
-                )
-        # sort the jobs by priority
-        sorted_jobs = sorted(job_priority, key=job_priority.get, reverse=True)  # type: ignore
-        # filter jobs by max_exec and priority greater zero
-        filtered_jobs = [
-            job
-            for idx, job in enumerate(sorted_jobs)
-            if (self.__max_exec == 0 or idx < self.__max_exec) and job_priority[job] > 0
-        ]
-        return self.__exec_jobs(filtered_jobs, ref_dt)
+                jobs.append(job)
+                priorities.append(priority_function(-delta_seconds, job, max_exec, n_jobs))
+        return self.__exec_jobs(self.__select_by_priority(jobs, priorities), ref_dt)
 
     def delete_job(self, job: Job) -> None:
         """
@@ -285,6 +434,8 @@ class Scheduler(BaseScheduler[Job, Callable[..., None]]):
         try:
             with self.__jobs_lock:
                 self.__jobs.remove(job)
+                unindex_job_tags(self.__tag_index, job)
+                self.__due_seq.pop(job, None)
         except KeyError:
             raise SchedulerError("An unscheduled Job can not be deleted!") from None
 
@@ -311,9 +462,15 @@ class Scheduler(BaseScheduler[Job, Callable[..., None]]):
             if tags is None or tags == set():
                 n_jobs = len(self.__jobs)
                 self.__jobs = set()
+                self.__tag_index.clear()
+                self.__due_heap.clear()
+                self.__due_seq.clear()
                 return n_jobs
 
-            to_delete = select_jobs_by_tag(self.__jobs, tags, any_tag)
+            to_delete = select_jobs_by_tag_index(self.__tag_index, tags, any_tag)
+            for job in to_delete:
+                unindex_job_tags(self.__tag_index, job)
+                self.__due_seq.pop(job, None)
 
             self.__jobs = self.__jobs - to_delete
             return len(to_delete)
@@ -346,7 +503,7 @@ class Scheduler(BaseScheduler[Job, Callable[..., None]]):
         with self.__jobs_lock:
             if tags is None or tags == set():
                 return self.__jobs.copy()
-            return select_jobs_by_tag(self.__jobs, tags, any_tag)
+            return select_jobs_by_tag_index(self.__tag_index, tags, any_tag)
 
     @deprecated(["delay"])
     def cyclic(self, timing: TimingCyclic, handle: Callable[..., None], **kwargs) -> Job:
@@ -379,11 +536,7 @@ class Scheduler(BaseScheduler[Job, Callable[..., None]]):
 
             .. include:: ../_assets/kwargs.rst
         """
-        try:
-            tg.check_type(timing, TimingCyclic)
-        except tg.TypeCheckError as err:
-            raise SchedulerError(CYCLIC_TYPE_ERROR_MSG) from err
-        return self.__schedule(job_type=JobType.CYCLIC, timing=timing, handle=handle, **kwargs)
+        return self.__schedule_timed(JobType.CYCLIC, timing, handle, **kwargs)
 
     @deprecated(["delay"])
     def minutely(self, timing: TimingDailyUnion, handle: Callable[..., None], **kwargs) -> Job:
@@ -421,11 +574,7 @@ class Scheduler(BaseScheduler[Job, Callable[..., None]]):
 
             .. include:: ../_assets/kwargs.rst
         """
-        try:
-            tg.check_type(timing, TimingDailyUnion)
-        except tg.TypeCheckError as err:
-            raise SchedulerError(MINUTELY_TYPE_ERROR_MSG) from err
-        return self.__schedule(job_type=JobType.MINUTELY, timing=timing, handle=handle, **kwargs)
+        return self.__schedule_timed(JobType.MINUTELY, timing, handle, **kwargs)
 
     @deprecated(["delay"])
     def hourly(self, timing: TimingDailyUnion, handle: Callable[..., None], **kwargs) -> Job:
@@ -463,11 +612,7 @@ class Scheduler(BaseScheduler[Job, Callable[..., None]]):
 
             .. include:: ../_assets/kwargs.rst
         """
-        try:
-            tg.check_type(timing, TimingDailyUnion)
-        except tg.TypeCheckError as err:
-            raise SchedulerError(HOURLY_TYPE_ERROR_MSG) from err
-        return self.__schedule(job_type=JobType.HOURLY, timing=timing, handle=handle, **kwargs)
+        return self.__schedule_timed(JobType.HOURLY, timing, handle, **kwargs)
 
     @deprecated(["delay"])
     def daily(self, timing: TimingDailyUnion, handle: Callable[..., None], **kwargs) -> Job:
@@ -500,11 +645,7 @@ class Scheduler(BaseScheduler[Job, Callable[..., None]]):
 
             .. include:: ../_assets/kwargs.rst
         """
-        try:
-            tg.check_type(timing, TimingDailyUnion)
-        except tg.TypeCheckError as err:
-            raise SchedulerError(DAILY_TYPE_ERROR_MSG) from err
-        return self.__schedule(job_type=JobType.DAILY, timing=timing, handle=handle, **kwargs)
+        return self.__schedule_timed(JobType.DAILY, timing, handle, **kwargs)
 
     @deprecated(["delay"])
     def weekly(self, timing: TimingWeeklyUnion, handle: Callable[..., None], **kwargs) -> Job:
@@ -539,11 +680,7 @@ class Scheduler(BaseScheduler[Job, Callable[..., None]]):
 
             .. include:: ../_assets/kwargs.rst
         """
-        try:
-            tg.check_type(timing, TimingWeeklyUnion)
-        except tg.TypeCheckError as err:
-            raise SchedulerError(WEEKLY_TYPE_ERROR_MSG) from err
-        return self.__schedule(job_type=JobType.WEEKLY, timing=timing, handle=handle, **kwargs)
+        return self.__schedule_timed(JobType.WEEKLY, timing, handle, **kwargs)
 
     def once(  # pylint: disable=arguments-differ
         self,
@@ -581,26 +718,23 @@ class Scheduler(BaseScheduler[Job, Callable[..., None]]):
         Job
             Instance of a scheduled |Job|.
         """
-        try:
-            tg.check_type(timing, TimingOnceUnion)
-        except tg.TypeCheckError as err:
-            raise SchedulerError(ONCE_TYPE_ERROR_MSG) from err
-        if isinstance(timing, dt.datetime):
+        job_type, at_datetime = once_job_type(timing)
+        if at_datetime:
             return self.__schedule(
-                job_type=JobType.CYCLIC,
+                job_type=job_type,
                 timing=dt.timedelta(),
                 handle=handle,
                 args=args,
                 kwargs=kwargs,
                 max_attempts=1,
-                tags=set(tags) if tags else set(),
+                tags=tags,
                 alias=alias,
                 weight=weight,
                 delay=False,
                 start=timing,
             )
         return self.__schedule(
-            job_type=JOB_TYPE_MAPPING[type(timing)],
+            job_type=job_type,
             timing=timing,
             handle=handle,
             args=args,
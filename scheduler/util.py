@@ -12,6 +12,10 @@ from scheduler.base.definition import JobType
 from scheduler.error import SchedulerError
 from scheduler.trigger.core import Weekday
 
+_ONE_DAY = dt.timedelta(days=1)
+_ONE_HOUR = dt.timedelta(hours=1)
+_ONE_MINUTE = dt.timedelta(minutes=1)
+
 
 def days_to_weekday(wkdy_src: int, wkdy_dest: int) -> int:
     """
@@ -64,8 +68,8 @@ def next_daily_occurrence(now: dt.datetime, target_time: dt.time) -> dt.datetime
         second=target_time.second,
         microsecond=target_time.microsecond,
     )
-    if (target - now).total_seconds() <= 0:
-        target = target + dt.timedelta(days=1)
+    if target <= now:
+        target = target + _ONE_DAY
     return target
 
 
@@ -92,8 +96,8 @@ def next_hourly_occurrence(now: dt.datetime, target_time: dt.time) -> dt.datetim
         second=target_time.second,
         microsecond=target_time.microsecond,
     )
-    if (target - now).total_seconds() <= 0:
-        target = target + dt.timedelta(hours=1)
+    if target <= now:
+        target = target + _ONE_HOUR
     return target
 
 
@@ -119,8 +123,8 @@ def next_minutely_occurrence(now: dt.datetime, target_time: dt.time) -> dt.datet
         second=target_time.second,
         microsecond=target_time.microsecond,
     )
-    if (target - now).total_seconds() <= 0:
-        return target + dt.timedelta(minutes=1)
+    if target <= now:
+        return target + _ONE_MINUTE
     return target
 
 
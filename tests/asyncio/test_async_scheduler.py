@@ -5,6 +5,7 @@ from typing import Optional
 
 import pytest
 
+from scheduler.asyncio.job import Job
 from scheduler.asyncio.scheduler import Scheduler
 from scheduler.base.timingtype import (
     TimingCyclic,
@@ -24,6 +25,8 @@ from ..helpers import (
     MISSING_EVENT_LOOP_ERROR,
     ONCE_TYPE_ERROR_MSG,
     WEEKLY_TYPE_ERROR_MSG,
+    FakeClock,
+    advance,
 )
 
 
@@ -78,6 +81,40 @@ async def test_delete_job(event_loop: BaseSelectorEventLoop) -> None:
         sch.delete_job(job1)
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("delete", ["job", "all", "tags"])
+async def test_delete_running_job(event_loop: BaseSelectorEventLoop, delete: str) -> None:
+    sch = Scheduler(loop=event_loop)
+    started = asyncio.Event()
+    log: list[str] = []
+
+    async def blocking() -> None:
+        log.append("start")
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            log.append("cancelled")
+            raise
+        log.append("end")
+
+    job = sch.once(dt.timedelta(), blocking, tags={"foo"})
+    await started.wait()
+
+    # deleting a job cancels its running execution
+    if delete == "job":
+        sch.delete_job(job)
+    elif delete == "all":
+        assert sch.delete_jobs() == 1
+    else:
+        assert sch.delete_jobs(tags={"foo"}) == 1
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert log == ["start", "cancelled"]
+    assert job.attempts == 0
+    assert sch.jobs == set()
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "tags, any_tag, length",
@@ -127,6 +164,51 @@ async def test_get_jobs_with_tags(
     sch.delete_jobs()
 
 
+@pytest.mark.asyncio
+async def test_jobs_snapshot(event_loop: BaseSelectorEventLoop) -> None:
+    sch = Scheduler(loop=event_loop)
+    job0 = sch.cyclic(dt.timedelta(seconds=1), foo)
+
+    # the returned sets are copies
+    jobs = sch.jobs
+    assert jobs == {job0}
+    jobs.clear()
+    assert sch.jobs == {job0}
+    sch.get_jobs().clear()
+    assert sch.jobs == {job0}
+    jobs = sch.jobs
+
+    job1 = sch.cyclic(dt.timedelta(seconds=1), foo)
+    assert jobs == {job0}
+    assert sch.jobs == {job0, job1}
+
+    sch.delete_job(job0)
+    assert sch.jobs == {job1}
+    sch.delete_jobs()
+    assert sch.jobs == set()
+
+
+@pytest.mark.asyncio
+async def test_get_jobs_after_delete(event_loop: BaseSelectorEventLoop) -> None:
+    sch = Scheduler(loop=event_loop)
+    job0 = sch.cyclic(dt.timedelta(seconds=1), foo, tags={"foo", "bar"})
+    job1 = sch.cyclic(dt.timedelta(seconds=1), foo, tags={"bar", "baz"})
+    job2 = sch.cyclic(dt.timedelta(seconds=1), foo, tags={"baz"})
+
+    assert sch.get_jobs({"bar", "baz"}) == {job1}
+    assert sch.get_jobs({"foo", "baz"}, any_tag=True) == {job0, job1, job2}
+    assert sch.get_jobs({"foo", "qux"}) == set()
+
+    sch.delete_job(job1)
+    assert sch.get_jobs({"bar"}) == {job0}
+    assert sch.get_jobs({"bar", "baz"}, any_tag=True) == {job0, job2}
+
+    assert sch.delete_jobs({"baz"}) == 1
+    assert sch.get_jobs({"baz"}) == set()
+    assert sch.get_jobs({"foo"}) == {job0}
+    sch.delete_jobs()
+
+
 @pytest.mark.asyncio
 async def test_async_list_timing(event_loop: BaseSelectorEventLoop) -> None:
     sch = Scheduler(loop=event_loop)
@@ -264,3 +346,22 @@ async def test_async_once_datetime(event_loop: BaseSelectorEventLoop) -> None:
 def test_async_scheduler_without_running_loop() -> None:
     with pytest.raises(SchedulerError, match=MISSING_EVENT_LOOP_ERROR):
         sch = Scheduler()
+
+
+@pytest.mark.asyncio
+async def test_async_heap_does_not_compare_jobs(
+    event_loop: BaseSelectorEventLoop, monkeypatch: pytest.MonkeyPatch, clock: FakeClock
+) -> None:
+    def no_lt(self: Job, other: Job) -> bool:
+        raise AssertionError("Job.__lt__ called by the heap")
+
+    monkeypatch.setattr(Job, "__lt__", no_lt)
+    sch = Scheduler(loop=event_loop)
+    for _ in range(8):
+        sch.cyclic(dt.timedelta(seconds=1), foo, max_attempts=2)
+
+    # all jobs share their due times
+    await advance(clock, 1)
+    assert len(sch.jobs) == 8
+    await advance(clock, 1)
+    assert len(sch.jobs) == 0
@@ -1,12 +1,12 @@
 """
-Tests for scheduler.asyncio.scheduler considering asyncio.sleep behaviour
+Tests for scheduler.asyncio.scheduler considering the timing of the supervisor.
 
-Heavy use of monkey-patching with the following behaviour:
+The clock of the scheduler is faked with the `clock` fixture of the conftest:
 
-* `dt.datetime.now()` increments the returned datetime by one second with each call
-* `dt.datetime.last_now()` gives the most recent value returned by `dt.datetime.now()`
-* `asyncio.sleep(delay)` will never sleep real time, but simply block until the next
-  event loop is executed, effectively behaving as `asyncio.sleep(0)`
+* the event loop's `time()` and `dt.datetime.now()` both follow a fake clock
+  that only moves if a test calls `advance(clock, seconds)`
+* `advance` lets the event loop run a fixed number of iterations without ever
+  blocking, so each assertion checks the exact number of executions
 
 Author: Jendrik A. Potyka, Fabian A. Preiss
 """
@@ -15,169 +15,178 @@ import asyncio
 import datetime as dt
 import logging
 from asyncio.selector_events import BaseSelectorEventLoop
-from typing import Any, NoReturn
+from typing import Any, NoReturn, Optional
 
 import pytest
 
 from scheduler.asyncio.scheduler import Scheduler
 
-from ..helpers import T_2021_5_26__3_55, fail
+from ..helpers import T_2021_5_26__3_55, FakeClock, advance, fail
 
-samples_secondly = [T_2021_5_26__3_55 + dt.timedelta(seconds=x) for x in range(12)]
-async_real_sleep = asyncio.sleep
 
+async def bar() -> None:
+    ...
 
-async def fake_sleep(delay: float, result: None = None) -> None:
-    """Fake asyncio.sleep, depends on monkeypatch `patch_datetime_now`"""
-    t_start = dt.datetime.last_now()
-    while True:
-        await asyncio.tasks.__sleep0()
-        if (dt.datetime.last_now() - t_start).total_seconds() >= delay:
-            break
-        else:
-            _ = dt.datetime.now()
-    return result
 
+async def blocking() -> None:
+    await asyncio.Event().wait()
 
-async def bar() -> None:
-    ...
 
+@pytest.mark.asyncio
+async def test_async_scheduler_cyclic(event_loop: BaseSelectorEventLoop, clock: FakeClock) -> None:
+    schedule = Scheduler(loop=event_loop)
+    cyclic_job = schedule.cyclic(dt.timedelta(seconds=1), bar)
+    assert cyclic_job.datetime == T_2021_5_26__3_55 + dt.timedelta(seconds=1)
+    assert cyclic_job.attempts == 0
+
+    await advance(clock, 0.5)
+    assert cyclic_job.attempts == 0
 
-@pytest.mark.parametrize(
-    "patch_datetime_now",
-    [samples_secondly],
-    indirect=["patch_datetime_now"],
-)
-def test_async_scheduler_cyclic1s(
-    monkeypatch: pytest.MonkeyPatch, patch_datetime_now: Any, event_loop: BaseSelectorEventLoop
+    for attempts in range(1, 4):
+        await advance(clock, 1)
+        assert cyclic_job.attempts == attempts
+        assert cyclic_job.datetime == T_2021_5_26__3_55 + dt.timedelta(seconds=attempts + 1)
+
+    schedule.delete_jobs()
+    await advance(clock, 2)
+    assert cyclic_job.attempts == 3
+
+
+@pytest.mark.asyncio
+async def test_async_scheduler_cyclic_max_attempts(
+    event_loop: BaseSelectorEventLoop, clock: FakeClock
 ) -> None:
-    async def main() -> None:
-        with monkeypatch.context() as m:
-            m.setattr(asyncio, "sleep", fake_sleep)
-            schedule = Scheduler()
+    schedule = Scheduler(loop=event_loop)
+    cyclic_job = schedule.cyclic(dt.timedelta(seconds=2), bar, max_attempts=2)
 
-            # schedule.__schedule calls: now, async: [now, async_sleep]
-            cyclic_job = schedule.cyclic(dt.timedelta(seconds=1), bar)
-            assert dt.datetime.last_now() == samples_secondly[0]
-            assert cyclic_job.datetime == samples_secondly[1]
-            assert cyclic_job.attempts == 0
+    await advance(clock, 1)
+    assert cyclic_job.attempts == 0
 
-            await asyncio.sleep(0)
-            assert dt.datetime.last_now() == samples_secondly[1]
-            assert cyclic_job.attempts == 0
+    await advance(clock, 2)
+    assert cyclic_job.attempts == 1
+    assert schedule.jobs == {cyclic_job}
 
-            await asyncio.sleep(0)
-            assert dt.datetime.last_now() == samples_secondly[2]
-            assert cyclic_job.attempts == 1
+    await advance(clock, 2)
+    assert cyclic_job.attempts == 2
+    assert schedule.jobs == set()
+    await advance(clock, 0)
 
-            await asyncio.sleep(0)
-            assert dt.datetime.last_now() == samples_secondly[3]
-            assert cyclic_job.attempts == 2
 
-            await asyncio.sleep(0)
-            assert dt.datetime.last_now() == samples_secondly[4]
-            assert cyclic_job.attempts == 3
+@pytest.mark.asyncio
+async def test_async_scheduler_cyclic_catch_up(
+    event_loop: BaseSelectorEventLoop, clock: FakeClock
+) -> None:
+    schedule = Scheduler(loop=event_loop)
+    cyclic_job = schedule.cyclic(dt.timedelta(seconds=1), bar)
+
+    # overdue executions are caught up at once
+    await advance(clock, 3.5)
+    assert cyclic_job.attempts == 3
+    assert cyclic_job.datetime == T_2021_5_26__3_55 + dt.timedelta(seconds=4)
 
-            schedule.delete_jobs()
-            await asyncio.sleep(0)
-            assert dt.datetime.last_now() == samples_secondly[4]
-            assert cyclic_job.attempts == 3
+    schedule.delete_jobs()
+    await advance(clock, 0)
 
-    event_loop.run_until_complete(main())
 
+@pytest.mark.asyncio
+async def test_async_scheduler_once(event_loop: BaseSelectorEventLoop, clock: FakeClock) -> None:
+    schedule = Scheduler(loop=event_loop)
+    once_job = schedule.once(dt.timedelta(seconds=1), bar)
+    due_at = once_job.datetime
 
-# NOTE: In the following test `sch.delete_jobs()` is run to suppress
-# the asyncio Warning "Task was destroyed but it is pending!" during testing
+    await advance(clock, 0.5)
+    assert once_job.attempts == 0
+    assert schedule.jobs == {once_job}
 
+    await advance(clock, 1)
+    assert once_job.attempts == 1
+    assert once_job.datetime == due_at
+    assert schedule.jobs == set()
+    await advance(clock, 0)
 
-@pytest.mark.parametrize(
-    "patch_datetime_now",
-    [samples_secondly],
-    indirect=["patch_datetime_now"],
-)
-def test_async_scheduler_cyclic2s(
-    monkeypatch: pytest.MonkeyPatch, patch_datetime_now: Any, event_loop: BaseSelectorEventLoop
+
+@pytest.mark.asyncio
+async def test_async_scheduler_cyclic_concurrent(
+    event_loop: BaseSelectorEventLoop, clock: FakeClock
 ) -> None:
-    async def main() -> None:
-        with monkeypatch.context() as m:
-            m.setattr(asyncio, "sleep", fake_sleep)
-            schedule = Scheduler()
+    schedule = Scheduler(loop=event_loop)
+    blocking_job = schedule.once(dt.timedelta(), blocking)
+    cyclic_job = schedule.cyclic(dt.timedelta(seconds=1), bar)
+
+    # a running job does not delay the execution of other jobs
+    await advance(clock, 0.5)
+    for attempts in range(1, 4):
+        await advance(clock, 1)
+        assert cyclic_job.attempts == attempts
+    assert blocking_job.attempts == 0
 
-            # schedule.__schedule calls: now, async: [now, async_sleep]
-            cyclic_job = schedule.cyclic(dt.timedelta(seconds=2), bar, max_attempts=3)
-            assert dt.datetime.last_now() == samples_secondly[0]
-            assert cyclic_job.datetime == samples_secondly[2]
-            assert cyclic_job.attempts == 0
+    schedule.delete_jobs()
+    await advance(clock, 0)
 
-            await asyncio.sleep(0)
-            assert dt.datetime.last_now() == samples_secondly[1]
-            assert cyclic_job.attempts == 0
 
-            await asyncio.sleep(0)
-            assert dt.datetime.last_now() == samples_secondly[2]
-            assert cyclic_job.attempts == 0
+@pytest.mark.asyncio
+async def test_async_scheduler_worker_reuse(
+    event_loop: BaseSelectorEventLoop, clock: FakeClock
+) -> None:
+    schedule = Scheduler(loop=event_loop)
+    exec_tasks: list[Optional[asyncio.Task[Any]]] = []
 
-            await asyncio.sleep(0)
-            assert dt.datetime.last_now() == samples_secondly[3]
-            assert cyclic_job.attempts == 1
+    async def record_task() -> None:
+        exec_tasks.append(asyncio.current_task())
 
-            await asyncio.sleep(0)
-            assert dt.datetime.last_now() == samples_secondly[4]
-            assert cyclic_job.attempts == 1
+    cyclic_job = schedule.cyclic(dt.timedelta(seconds=1), record_task)
 
-            await asyncio.sleep(0)
-            assert dt.datetime.last_now() == samples_secondly[5]
-            assert cyclic_job.attempts == 2
-            schedule.delete_jobs()
+    await advance(clock, 1.5)
+    assert cyclic_job.attempts == 1
+    (worker,) = exec_tasks
+    assert worker is not None
 
-    event_loop.run_until_complete(main())
+    # the parked worker executes the following runs
+    await advance(clock, 2)
+    assert cyclic_job.attempts == 3
+    assert exec_tasks == [worker] * 3
+    assert not worker.done()
+
+    # without jobs the idle worker is released
+    schedule.delete_jobs()
+    await advance(clock, 0.5)
+    assert worker.done()
 
 
 async def async_fail() -> NoReturn:
     fail()
 
 
-@pytest.mark.parametrize(
-    "patch_datetime_now",
-    [samples_secondly],
-    indirect=["patch_datetime_now"],
-)
-def test_asyncio_fail(
-    monkeypatch: pytest.MonkeyPatch,
-    patch_datetime_now: Any,
+@pytest.mark.asyncio
+async def test_asyncio_fail(
     event_loop: BaseSelectorEventLoop,
+    clock: FakeClock,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     caplog.set_level(logging.DEBUG, logger="scheduler")
 
-    async def main() -> None:
-        with monkeypatch.context() as m:
-            m.setattr(asyncio, "sleep", fake_sleep)
-            schedule = Scheduler()
-            cyclic_job = schedule.cyclic(dt.timedelta(seconds=1), async_fail)
-            assert dt.datetime.last_now() == samples_secondly[0]
-            assert cyclic_job.datetime == samples_secondly[1]
-            assert cyclic_job.attempts == 0
-
-            RECORD = (
-                "scheduler",
-                logging.ERROR,
-                "Unhandled exception in `%r`!" % (cyclic_job,),
-            )
-
-            await asyncio.sleep(0)
-            assert dt.datetime.last_now() == samples_secondly[1]
-            assert cyclic_job.attempts == 0
-
-            await asyncio.sleep(0)
-            assert dt.datetime.last_now() == samples_secondly[2]
-            assert cyclic_job.attempts == 1
-            assert cyclic_job.failed_attempts == 1
-            assert caplog.record_tuples == [RECORD]
-
-            await asyncio.sleep(0)
-            assert cyclic_job.attempts == 2
-            assert cyclic_job.failed_attempts == 2
-            assert caplog.record_tuples == [RECORD, RECORD]
-
-    event_loop.run_until_complete(main())
+    schedule = Scheduler(loop=event_loop)
+    cyclic_job = schedule.cyclic(dt.timedelta(seconds=1), async_fail)
+    assert cyclic_job.attempts == 0
+
+    RECORD = (
+        "scheduler",
+        logging.ERROR,
+        "Unhandled exception in `%r`!" % (cyclic_job,),
+    )
+
+    await advance(clock, 0.5)
+    assert cyclic_job.attempts == 0
+
+    await advance(clock, 1)
+    assert cyclic_job.attempts == 1
+    assert cyclic_job.failed_attempts == 1
+    assert caplog.record_tuples == [RECORD]
+
+    await advance(clock, 1)
+    assert cyclic_job.attempts == 2
+    assert cyclic_job.failed_attempts == 2
+    assert caplog.record_tuples == [RECORD, RECORD]
+
+    schedule.delete_jobs()
+    await advance(clock, 0)
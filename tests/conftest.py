@@ -1,9 +1,12 @@
 import datetime as dt
+from asyncio.selector_events import BaseSelectorEventLoop
 from collections.abc import Iterator
 from typing import Optional
 
 import pytest
 
+from .helpers import FakeClock
+
 
 @pytest.fixture
 def one() -> int:
@@ -36,3 +39,17 @@ def patch_datetime_now(monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureR
             return s.replace("DatetimePatch", "datetime.datetime")
 
     monkeypatch.setattr(dt, "datetime", DatetimePatch)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch, event_loop: BaseSelectorEventLoop) -> FakeClock:
+    fake_clock = FakeClock(event_loop.time())
+
+    class DatetimePatch(dt.datetime):
+        @classmethod
+        def now(cls, tz: Optional[dt.tzinfo] = None) -> dt.datetime:  # type: ignore[override]
+            return fake_clock.now(tz)
+
+    monkeypatch.setattr(event_loop, "time", fake_clock.time)
+    monkeypatch.setattr(dt, "datetime", DatetimePatch)
+    return fake_clock
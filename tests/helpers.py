@@ -1,5 +1,6 @@
+import asyncio
 import datetime as dt
-from typing import NoReturn
+from typing import NoReturn, Optional
 
 import scheduler.trigger as trigger
 from scheduler.base.definition import JobType
@@ -419,3 +420,29 @@ job_reprs_utc = (
         )
     ],
 )
+
+
+# event loop iterations to run after advancing a `FakeClock`, enough for a timer
+# callback, the job execution and the rescheduling by the supervisor
+N_STEPS = 20
+
+
+class FakeClock:
+    """Clock shared by the event loop and `dt.datetime.now()`, see the `clock` fixture."""
+
+    def __init__(self, loop_time: float) -> None:
+        self.loop_time = loop_time
+        self.seconds = 0.0
+
+    def time(self) -> float:
+        return self.loop_time + self.seconds
+
+    def now(self, tz: Optional[dt.tzinfo] = None) -> dt.datetime:
+        return (T_2021_5_26__3_55 + dt.timedelta(seconds=self.seconds)).replace(tzinfo=tz)
+
+
+async def advance(clock: FakeClock, seconds: float) -> None:
+    """Move the `clock` and run the event loop without ever blocking."""
+    clock.seconds += seconds
+    for _ in range(N_STEPS):
+        await asyncio.sleep(0)
@@ -10,7 +10,15 @@ from scheduler.base.job_timer import JobTimer
 from scheduler.base.job_util import sane_timing_types
 from scheduler.base.timingtype import TimingJobTimerUnion, TimingJobUnion
 
-from .helpers import CYCLIC_TYPE_ERROR_MSG, T_2021_5_26__3_55, utc
+from .helpers import (
+    CYCLIC_TYPE_ERROR_MSG,
+    DAILY_TYPE_ERROR_MSG,
+    HOURLY_TYPE_ERROR_MSG,
+    MINUTELY_TYPE_ERROR_MSG,
+    T_2021_5_26__3_55,
+    WEEKLY_TYPE_ERROR_MSG,
+    utc,
+)
 
 
 @pytest.mark.parametrize(
@@ -122,12 +130,12 @@ def test_skip(delta_m: int, offset_m: int, skip: bool, res_delta_m: int) -> None
         [JobType.HOURLY, [dt.time(), dt.time()], None],
         [JobType.MINUTELY, [dt.time()], None],
         [JobType.MINUTELY, [dt.time(), dt.time()], None],
-        # [JobType.CYCLIC, (dt.timedelta(), dt.timedelta()), CYCLIC_TYPE_ERROR_MSG],
-        # [JobType.WEEKLY, dt.time(), WEEKLY_TYPE_ERROR_MSG],
-        # [JobType.WEEKLY, [trigger.Monday(), dt.time()], WEEKLY_TYPE_ERROR_MSG],
-        # [JobType.DAILY, (dt.time(), dt.time()), DAILY_TYPE_ERROR_MSG],
-        # [JobType.HOURLY, (dt.time(), dt.time()), HOURLY_TYPE_ERROR_MSG],
-        # [JobType.MINUTELY, (dt.time(), dt.time()), MINUTELY_TYPE_ERROR_MSG],
+        [JobType.CYCLIC, (dt.timedelta(), dt.timedelta()), CYCLIC_TYPE_ERROR_MSG],
+        [JobType.WEEKLY, dt.time(), WEEKLY_TYPE_ERROR_MSG],
+        [JobType.WEEKLY, [trigger.Monday(), dt.time()], WEEKLY_TYPE_ERROR_MSG],
+        [JobType.DAILY, (dt.time(), dt.time()), DAILY_TYPE_ERROR_MSG],
+        [JobType.HOURLY, (dt.time(), dt.time()), HOURLY_TYPE_ERROR_MSG],
+        [JobType.MINUTELY, (dt.time(), dt.time()), MINUTELY_TYPE_ERROR_MSG],
     ),
 )
 def test_sane_timing_types(job_type: JobType, timing: TimingJobUnion, err: Optional[str]) -> None:
@@ -4,8 +4,12 @@ from typing import Optional, Union
 import pytest
 
 import scheduler.trigger as trigger
-from scheduler.base.scheduler_util import str_cutoff
+from scheduler.base.definition import JobType
+from scheduler.base.job_util import prettify_timedelta
+from scheduler.base.scheduler import select_jobs_by_tag
+from scheduler.base.scheduler_util import TIMING_VALIDATORS, once_job_type, str_cutoff
 from scheduler.error import SchedulerError
+from scheduler.threading.job import Job
 from scheduler.trigger.core import Weekday, _Weekday
 from scheduler.util import (
     days_to_weekday,
@@ -185,3 +189,84 @@ def test_str_cutoff(
             str_cutoff(string, max_length, cut_tail)
     else:
         assert str_cutoff(string, max_length, cut_tail) == result
+
+
+@pytest.mark.parametrize(
+    "job_type, timing, valid",
+    [
+        (JobType.CYCLIC, dt.timedelta(seconds=1), True),
+        (JobType.CYCLIC, dt.time(), False),
+        (JobType.MINUTELY, dt.time(second=5), True),
+        (JobType.HOURLY, [dt.time(minute=1), dt.time(minute=2)], True),
+        (JobType.DAILY, [dt.time(), dt.timedelta()], False),
+        (JobType.DAILY, trigger.Monday(), False),
+        (JobType.WEEKLY, trigger.Monday(), True),
+        (JobType.WEEKLY, [trigger.Monday(), trigger.Friday(dt.time(1))], True),
+        (JobType.WEEKLY, [trigger.Monday(), dt.time()], False),
+    ],
+)
+def test_timing_validators(job_type: JobType, timing: object, valid: bool) -> None:
+    assert TIMING_VALIDATORS[job_type](timing) is valid
+
+
+class _DateTime(dt.datetime):
+    pass
+
+
+@pytest.mark.parametrize(
+    "timing, result",
+    [
+        (dt.datetime(2021, 1, 1), (JobType.CYCLIC, True)),
+        (_DateTime(2021, 1, 1), (JobType.CYCLIC, True)),
+        (dt.timedelta(), (JobType.CYCLIC, False)),
+        (dt.time(), (JobType.DAILY, False)),
+        (trigger.Sunday(), (JobType.WEEKLY, False)),
+        ([dt.time()], None),
+        (1, None),
+    ],
+)
+def test_once_job_type(timing: object, result: Optional[tuple[JobType, bool]]) -> None:
+    if result is None:
+        with pytest.raises(SchedulerError):
+            once_job_type(timing)
+    else:
+        assert once_job_type(timing) == result
+
+
+@pytest.mark.parametrize(
+    "timedelta, result",
+    [
+        (dt.timedelta(), "0:00:00"),
+        (dt.timedelta(seconds=45, microseconds=999999), "0:00:45"),
+        (dt.timedelta(hours=23, minutes=59, seconds=59), "23:59:59"),
+        (dt.timedelta(days=1, hours=3), "1 day"),
+        (dt.timedelta(days=13), "13 days"),
+        (dt.timedelta(microseconds=-1), "-0:00:00"),
+        (dt.timedelta(seconds=-45), "-0:00:45"),
+        (dt.timedelta(hours=-5, minutes=-7), "-5:07:00"),
+        (dt.timedelta(days=-1), "-1 day"),
+        (dt.timedelta(days=-2, seconds=-1), "-2 days"),
+    ],
+)
+def test_prettify_timedelta(timedelta: dt.timedelta, result: str) -> None:
+    assert prettify_timedelta(timedelta) == result
+
+
+@pytest.mark.parametrize(
+    "tags, any_tag, selected",
+    [
+        (set(), True, []),
+        (set(), False, [0, 1, 2]),
+        ({"a"}, True, [0, 1]),
+        ({"a"}, False, [0, 1]),
+        ({"a", "b"}, True, [0, 1, 2]),
+        ({"a", "b"}, False, [1]),
+        ({"c"}, False, []),
+    ],
+)
+def test_select_jobs_by_tag(tags: set[str], any_tag: bool, selected: list[int]) -> None:
+    jobs = [
+        Job(JobType.CYCLIC, [dt.timedelta(seconds=1)], lambda: None, tags=job_tags)
+        for job_tags in ({"a"}, {"a", "b"}, {"b"})
+    ]
+    assert select_jobs_by_tag(jobs, tags, any_tag) == {jobs[idx] for idx in selected}
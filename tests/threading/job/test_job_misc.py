@@ -54,6 +54,15 @@ def test_misc_properties(recwarn: pytest.WarningsRecorder) -> None:
     )
 
 
+def test_kwargs_copied() -> None:
+    kwargs = {"abc": 123}
+    job = Job(JobType.CYCLIC, [dt.timedelta()], foo, kwargs=kwargs)
+
+    # changes of the given dict do not change the arguments of the job
+    kwargs["abc"] = 456
+    assert job.kwargs == {"abc": 123}
+
+
 @pytest.mark.parametrize(
     "start_1, start_2, tzinfo, result",
     (
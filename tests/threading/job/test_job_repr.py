@@ -23,3 +23,14 @@ def test_job_repr(
 
     # result is broken into substring at every address. Address string is 12 long
     assert len(rep) == (len(result) - 1) * 12
+
+
+def test_job_repr_cached_fields() -> None:
+    job = Job(**job_args[0])
+    rep = repr(job)
+    assert repr(job) == rep
+
+    # the payload is not part of the cached representation
+    job.kwargs["key"] = "value"
+    assert repr(job) != rep
+    assert "'key': 'value'" in repr(job)
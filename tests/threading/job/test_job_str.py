@@ -1,3 +1,4 @@
+import logging
 from typing import Any
 
 import pytest
@@ -40,3 +41,18 @@ def test_job_str(
     for kwargs, result in zip(job_kwargs, results):
         job = Job(**kwargs)
         assert result == str(job)
+
+
+@pytest.mark.parametrize(
+    "patch_datetime_now",
+    [[T_2021_5_26__3_55] * 3],
+    indirect=["patch_datetime_now"],
+)
+def test_job_str_cached_fields(patch_datetime_now: Any) -> None:
+    job = Job(**job_args[1])
+    assert str(job).endswith("#0/20, w=0")
+
+    # the attempts are not part of the cached fragments
+    job._exec(logger=logging.getLogger("scheduler"))
+    assert str(job).startswith("MINUTELY, bar(..), ")
+    assert str(job).endswith("#1/20, w=0")
@@ -1,10 +1,16 @@
 import datetime as dt
+from typing import Any, Callable
 
 import pytest
 
-from scheduler import Scheduler
+from scheduler import Scheduler, SchedulerError
+from scheduler.prioritization import (
+    constant_weight_prioritization,
+    linear_priority_function,
+)
+from scheduler.threading.job import Job
 
-from ...helpers import foo
+from ...helpers import DELETE_NOT_SCHEDULED_ERROR, T_2021_5_26__3_55, foo
 
 
 @pytest.mark.parametrize(
@@ -28,3 +34,66 @@ def test_exec_all_jobs(n_jobs: int) -> None:
     exec_job_count = sch.exec_jobs(force_exec_all=True)
     assert exec_job_count == n_jobs
     assert len(sch.jobs) == 0
+
+
+@pytest.mark.parametrize(
+    "priority_function",
+    [linear_priority_function, constant_weight_prioritization],
+)
+def test_exec_due_jobs(priority_function: Callable[[float, Job, int, int], float]) -> None:
+    sch = Scheduler(priority_function=priority_function)
+    due_job = sch.cyclic(dt.timedelta(), foo, weight=1)
+    # a due job without weight is not executed
+    sch.cyclic(dt.timedelta(), foo, weight=0)
+    for _ in range(3):
+        sch.daily(dt.time(), foo)
+
+    assert sch.exec_jobs() == 1
+    assert due_job.attempts == 1
+    # the executed job is rescheduled and due again
+    assert sch.exec_jobs() == 1
+    assert due_job.attempts == 2
+
+    sch.delete_job(due_job)
+    assert sch.exec_jobs() == 0
+    sch.delete_jobs()
+    assert sch.exec_jobs() == 0
+
+
+@pytest.mark.parametrize(
+    "patch_datetime_now",
+    [[T_2021_5_26__3_55 + dt.timedelta(seconds=x) for x in (0, 2, 10)]],
+    indirect=["patch_datetime_now"],
+)
+def test_exec_jobs_now_resolution(patch_datetime_now: Any) -> None:
+    sch = Scheduler(now_resolution=60)
+    assert ", now_resolution=60, jobs={" in repr(sch)
+    job = sch.cyclic(dt.timedelta(seconds=1), foo, skip_missing=True)
+    assert job.datetime == T_2021_5_26__3_55 + dt.timedelta(seconds=1)
+
+    assert sch.exec_jobs() == 1
+    assert job.datetime == T_2021_5_26__3_55 + dt.timedelta(seconds=3)
+    # the reference time of the previous call is reused within the resolution
+    assert sch.exec_jobs() == 0
+    assert dt.datetime.last_now() == T_2021_5_26__3_55 + dt.timedelta(seconds=2)
+    assert job.attempts == 1
+
+
+def delete_self(sch: Scheduler, tags: set[str]) -> None:
+    sch.delete_jobs(tags=tags)
+
+
+def test_exec_jobs_deleted_during_execution() -> None:
+    sch = Scheduler()
+    # a job with remaining attempts deleted during its execution is dropped
+    cyclic_job = sch.cyclic(dt.timedelta(), delete_self, args=(sch, {"cyclic"}), tags={"cyclic"})
+    assert sch.exec_jobs() == 1
+    assert cyclic_job.attempts == 1
+    assert sch.jobs == set()
+
+    # a finished job can't be deleted twice, other finished jobs are still deleted
+    sch.once(dt.timedelta(), delete_self, args=(sch, {"once"}), tags={"once"})
+    sch.once(dt.timedelta(), foo)
+    with pytest.raises(SchedulerError, match=DELETE_NOT_SCHEDULED_ERROR):
+        sch.exec_jobs()
+    assert sch.jobs == set()
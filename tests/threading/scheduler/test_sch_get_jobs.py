@@ -124,3 +124,41 @@ def test_get_tagged_jobs(
             assert job in res
         else:
             assert job not in res
+
+
+def test_get_jobs_after_delete() -> None:
+    job0 = Job(JobType.CYCLIC, [dt.timedelta(seconds=1)], foo, tags={"foo", "bar"})
+    sch = Scheduler(jobs={job0})
+    job1 = sch.cyclic(dt.timedelta(seconds=1), foo, tags={"bar", "baz"})
+    job2 = sch.cyclic(dt.timedelta(seconds=1), foo, tags={"baz"})
+
+    assert sch.get_jobs({"bar", "baz"}) == {job1}
+    assert sch.get_jobs({"foo", "baz"}, any_tag=True) == {job0, job1, job2}
+    assert sch.get_jobs({"foo", "qux"}) == set()
+
+    sch.delete_job(job1)
+    assert sch.get_jobs({"bar"}) == {job0}
+    assert sch.get_jobs({"bar", "baz"}, any_tag=True) == {job0, job2}
+
+    assert sch.delete_jobs({"baz"}) == 1
+    assert sch.get_jobs({"baz"}) == set()
+    assert sch.get_jobs({"foo"}) == {job0}
+
+    assert sch.delete_jobs() == 1
+    assert sch.get_jobs({"foo"}) == set()
+
+
+def test_jobs_copy() -> None:
+    sch = Scheduler()
+    job = sch.cyclic(dt.timedelta(seconds=1), foo)
+
+    # the returned sets are copies
+    jobs = sch.jobs
+    assert jobs == {job}
+    jobs.clear()
+    assert sch.jobs == {job}
+    sch.get_jobs().clear()
+    assert sch.jobs == {job}
+
+    sch.delete_job(job)
+    assert sch.jobs == set()
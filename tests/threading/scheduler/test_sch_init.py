@@ -65,3 +65,14 @@ def test_sch_init(
             priority_function=priority_function,
             jobs=jobs,
         )
+
+
+def test_sch_init_copies_jobs() -> None:
+    job = Job(JobType.CYCLIC, [dt.timedelta()], foo)
+    jobs = {job}
+    sch = Scheduler(jobs=jobs)
+
+    # the scheduler does not share the given set
+    jobs.add(Job(JobType.CYCLIC, [dt.timedelta()], foo))
+    assert sch.jobs == {job}
+    assert sch.exec_jobs() == 1